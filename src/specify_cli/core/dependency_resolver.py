@@ -6,7 +6,9 @@ merged to main before implementing a dependent WP, avoiding auto-merge conflicts
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from specify_cli.frontmatter import read_frontmatter
@@ -118,12 +120,72 @@ def check_dependency_status(
     )
 
 
+@lru_cache(maxsize=1)
+def _merge_tree_supports_stdin() -> bool:
+    """Return True if the installed git has ``merge-tree --stdin`` (2.40+).
+
+    Checked once per process so older git never starts a batch that is
+    bound to fail. An unknown or unparseable version counts as unsupported.
+    """
+    from specify_cli.core.vcs import get_git_version
+
+    match = re.match(r"(\d+)\.(\d+)", get_git_version() or "")
+    return match is not None and (int(match.group(1)), int(match.group(2))) >= (2, 40)
+
+
+def _merge_tree_conflicts(
+    repo_root: Path, target: str, branches: list[str]
+) -> list[list[str]] | None:
+    """Simulate all merges in one ``git merge-tree --stdin`` process.
+
+    Each input line ``<target> <branch>`` produces a NUL-separated record
+    ``<clean>\0<tree>\0[<path>\0...]\0``. Paths are never empty, so
+    records are delimited by a double NUL.
+
+    Returns:
+        Conflicted paths per branch in input order, or None if the batch
+        failed (git < 2.40, any ref that cannot be resolved, or git missing)
+    """
+    import subprocess
+
+    if not _merge_tree_supports_stdin():
+        return None
+
+    try:
+        result = subprocess.run(
+            ["git", "merge-tree", "--stdin", "--name-only", "--no-messages"],
+            cwd=repo_root,
+            input="".join(f"{target} {branch}\n" for branch in branches).encode("utf-8"),
+            capture_output=True,
+            check=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+
+    records = result.stdout.split(b"\0\0")[: len(branches)]
+    if len(records) != len(branches):
+        return None
+
+    per_branch = []
+    for record in records:
+        try:
+            clean, _tree, *paths = record.split(b"\0")
+        except ValueError:
+            return None
+        per_branch.append([] if clean == b"1" else [path.decode("utf-8", errors="replace") for path in paths])
+    return per_branch
+
+
 def predict_merge_conflicts(
     repo_root: Path, branches: list[str], target: str | None = None
 ) -> dict[str, list[str]]:
     """Predict which files will conflict when merging branches.
 
-    Uses git merge-tree to simulate merge without touching working directory.
+    Uses ``git merge-tree --write-tree`` (git 2.38+) to simulate each merge
+    in memory, without touching the index or working directory. All
+    branches go through a single ``--stdin`` batch when git supports it.
 
     Args:
         repo_root: Repository root path
@@ -140,37 +202,36 @@ def predict_merge_conflicts(
         from specify_cli.core.git_ops import resolve_primary_branch
         target = resolve_primary_branch(repo_root)
 
-    conflicts = {}
-
-    # Check each branch against target
-    for branch in branches:
-        try:
-            # git merge-tree: simulate merge without touching working tree
-            result = subprocess.run(
-                ["git", "merge-tree", target, branch],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                check=False,
-            )
-
-            # Parse output for conflict markers
-            if result.returncode != 0 or "<<<<<<<" in result.stdout:
-                # Has conflicts - parse which files
-                for line in result.stdout.split("\n"):
-                    if line.startswith("CONFLICT"):
-                        # Example: "CONFLICT (add/add): Merge conflict in .gitignore"
-                        if " in " in line:
-                            file_path = line.split(" in ")[-1].strip()
-                            if file_path not in conflicts:
-                                conflicts[file_path] = []
-                            conflicts[file_path].append(branch)
-
-        except Exception:
-            # merge-tree failed or not available - skip prediction
-            pass
+    conflicts: dict[str, list[str]] = {}
+    if not branches:
+        return conflicts
+
+    per_branch = _merge_tree_conflicts(repo_root, target, branches)
+    if per_branch is None:
+        # Batch mode unavailable or a ref is bad - merge one branch at a time
+        per_branch = []
+        for branch in branches:
+            try:
+                result = subprocess.run(
+                    ["git", "merge-tree", "--write-tree", "--name-only", "-z", "--no-messages", target, branch],
+                    cwd=repo_root,
+                    capture_output=True,
+                    check=False,
+                )
+            except Exception:
+                per_branch.append([])
+                continue
+
+            # Exit 0 = clean, 1 = conflicts, anything else = merge-tree failed
+            if result.returncode != 1:
+                per_branch.append([])
+                continue
+            _tree, *paths = result.stdout.rstrip(b"\0").split(b"\0")
+            per_branch.append([path.decode("utf-8", errors="replace") for path in paths])
+
+    for branch, paths in zip(branches, per_branch):
+        for file_path in paths:
+            conflicts.setdefault(file_path, []).append(branch)
 
     return conflicts
 
@@ -9,6 +9,7 @@ LLMs and scripts should NEVER manually edit YAML frontmatter.
 
 from __future__ import annotations
 
+import copy
 import re
 from datetime import datetime
 from pathlib import Path
@@ -53,6 +54,9 @@ class FrontmatterManager:
         "history",
     ]
 
+    # Maximum number of parsed frontmatter blocks kept by _load()
+    PARSE_CACHE_SIZE = 1024
+
     def __init__(self):
         """Initialize with ruamel.yaml configured for consistency."""
         self.yaml = YAML()
@@ -60,6 +64,29 @@ class FrontmatterManager:
         self.yaml.preserve_quotes = False  # Don't preserve quotes - let YAML decide
         self.yaml.width = 4096  # Prevent line wrapping
         self.yaml.indent(mapping=2, sequence=2, offset=0)
+        self._parse_cache: Dict[str, Any] = {}
+
+    def _load(self, frontmatter_text: str) -> Any:
+        """Parse frontmatter YAML, reusing earlier parses of identical text.
+
+        Round-trip parsing is by far the slowest part of ``read()``, and the
+        same WP files are read many times per command. The cache is keyed
+        on the text itself, so edits are never served stale, and callers get
+        a deep copy they are free to mutate.
+
+        Args:
+            frontmatter_text: YAML between the ``---`` delimiters
+
+        Returns:
+            Parsed frontmatter (None for an empty block)
+        """
+        cached = self._parse_cache.get(frontmatter_text)
+        if cached is None:
+            cached = self.yaml.load(frontmatter_text)
+            if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+                self._parse_cache.pop(next(iter(self._parse_cache)))
+            self._parse_cache[frontmatter_text] = cached
+        return copy.deepcopy(cached)
 
     def read(self, file_path: Path) -> tuple[Dict[str, Any], str]:
         """Read frontmatter and body from a markdown file.
@@ -76,10 +103,26 @@ class FrontmatterManager:
         if not file_path.exists():
             raise FrontmatterError(f"File not found: {file_path}")
 
-        content = file_path.read_text(encoding="utf-8-sig")
+        return self.parse(file_path.read_text(encoding="utf-8-sig"), file_path)
+
+    def parse(self, content: str, file_path: Optional[Path] = None) -> tuple[Dict[str, Any], str]:
+        """Parse frontmatter and body from markdown text.
+
+        Args:
+            content: Markdown text starting with a ``---`` frontmatter block
+            file_path: Path the text came from, used in error messages and
+                to decide whether the WP ``dependencies`` default applies
+
+        Returns:
+            Tuple of (frontmatter_dict, body_text)
+
+        Raises:
+            FrontmatterError: If text has no frontmatter or is malformed
+        """
+        source = file_path if file_path is not None else "<string>"
 
         if not content.startswith("---"):
-            raise FrontmatterError(f"File has no frontmatter: {file_path}")
+            raise FrontmatterError(f"File has no frontmatter: {source}")
 
         # Find closing ---
         lines = content.split("\n")
@@ -90,19 +133,19 @@ class FrontmatterManager:
                 break
 
         if closing_idx == -1:
-            raise FrontmatterError(f"Malformed frontmatter (no closing ---): {file_path}")
+            raise FrontmatterError(f"Malformed frontmatter (no closing ---): {source}")
 
         # Parse frontmatter
         frontmatter_text = "\n".join(lines[1:closing_idx])
         try:
-            frontmatter = self.yaml.load(frontmatter_text)
+            frontmatter = self._load(frontmatter_text)
             if frontmatter is None:
                 frontmatter = {}
         except Exception as e:
-            raise FrontmatterError(f"Invalid YAML in {file_path}: {e}")
+            raise FrontmatterError(f"Invalid YAML in {source}: {e}")
 
         # Ensure dependencies field exists for WP files only (backward compatibility with pre-0.11.0)
-        if file_path.name.startswith("WP") and "dependencies" not in frontmatter:
+        if file_path is not None and file_path.name.startswith("WP") and "dependencies" not in frontmatter:
             frontmatter["dependencies"] = []
 
         # Get body (everything after closing ---)
@@ -310,6 +353,11 @@ def read_frontmatter(file_path: Path) -> tuple[Dict[str, Any], str]:
     return _manager.read(file_path)
 
 
+def read_frontmatter_str(content: str) -> tuple[Dict[str, Any], str]:
+    """Parse frontmatter and body from markdown text."""
+    return _manager.parse(content)
+
+
 def write_frontmatter(file_path: Path, frontmatter: Dict[str, Any], body: str) -> None:
     """Write frontmatter and body to a markdown file."""
     _manager.write(file_path, frontmatter, body)
@@ -374,6 +422,7 @@ __all__ = [
     "FrontmatterError",
     "FrontmatterManager",
     "read_frontmatter",
+    "read_frontmatter_str",
     "write_frontmatter",
     "update_field",
     "update_fields",
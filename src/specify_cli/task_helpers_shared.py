@@ -34,6 +34,25 @@ TIMESTAMP_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
 LEGACY_LANE_DIRS: List[str] = ["planned", "doing", "for_review", "done"]
 """Lane directories that indicate legacy format when they contain .md files."""
 
+_HISTORY_KEY_RE = re.compile(r"^\s*history:\s*$", flags=re.MULTILINE)
+"""Top-level ``history:`` key in raw frontmatter (insertion anchor)."""
+
+_ACTIVITY_LOG_SECTION_RE = re.compile(
+    r"(## Activity Log.*?)(?=\n## |\Z)", flags=re.DOTALL
+)
+"""The ``## Activity Log`` section of a document body, up to the next heading."""
+
+_ACTIVITY_ENTRY_RE = re.compile(
+    r"^\s*-\s*"
+    r"(?P<timestamp>[0-9T:-]+Z)\s+[–-]\s+"
+    r"(?P<agent>\S+(?:\s+\S+)*?)\s+[–-]\s+"
+    r"(?:shell_pid=(?P<shell>\S*)\s+[–-]\s+)?"
+    r"lane=(?P<lane>[a-z_]+)\s+[–-]\s+"
+    r"(?P<note>.*)$",
+    flags=re.MULTILINE,
+)
+"""A single activity log entry line."""
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -403,9 +422,7 @@ def set_scalar(frontmatter: str, key: str, value: str) -> str:
         )
 
     insertion = f"{replacement_line}\n"
-    history_match = re.compile(r"^\s*history:\s*$", flags=re.MULTILINE).search(
-        frontmatter
-    )
+    history_match = _HISTORY_KEY_RE.search(frontmatter)
     if history_match:
         idx = history_match.start()
         return frontmatter[:idx] + insertion + frontmatter[idx:]
@@ -487,8 +504,7 @@ def append_activity_log(body: str, entry: str) -> str:
             return body.rstrip() + "\n\n" + block
         return body + "\n" + block if body else block
 
-    pattern = re.compile(r"(## Activity Log.*?)(?=\n## |\Z)", flags=re.DOTALL)
-    match = pattern.search(body)
+    match = _ACTIVITY_LOG_SECTION_RE.search(body)
     if not match:
         return body + ("\n" if not body.endswith("\n") else "") + entry + "\n"
 
@@ -512,17 +528,8 @@ def activity_entries(body: str) -> List[Dict[str, str]]:
         List of dicts with keys ``timestamp``, ``agent``, ``lane``, ``note``,
         and ``shell_pid``.
     """
-    pattern = re.compile(
-        r"^\s*-\s*"
-        r"(?P<timestamp>[0-9T:-]+Z)\s+[–-]\s+"
-        r"(?P<agent>\S+(?:\s+\S+)*?)\s+[–-]\s+"
-        r"(?:shell_pid=(?P<shell>\S*)\s+[–-]\s+)?"
-        r"lane=(?P<lane>[a-z_]+)\s+[–-]\s+"
-        r"(?P<note>.*)$",
-        flags=re.MULTILINE,
-    )
     entries: List[Dict[str, str]] = []
-    for match in pattern.finditer(body):
+    for match in _ACTIVITY_ENTRY_RE.finditer(body):
         entries.append(
             {
                 "timestamp": match.group("timestamp").strip(),
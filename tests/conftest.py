@@ -13,11 +13,56 @@ import pytest
 from tests.utils import REPO_ROOT, run, run_tasks_cli, write_wp
 
 
+_SHM_DIR = Path("/dev/shm")
+_SHM_MIN_FREE = 1 << 30  # Docker's default 64 MB /dev/shm is too small for a full run
+
+# Environment changes made in pytest_configure, undone in pytest_unconfigure
+_CONFIG_ENV = pytest.MonkeyPatch()
+
+
+def _use_tmpfs_basetemp(config: pytest.Config) -> None:
+    """Root ``tmp_path`` on tmpfs when available, unless the user picked a location.
+
+    Set ``SPEC_KITTY_TEST_NO_TMPFS=1`` to keep pytest's default temp root,
+    e.g. where /dev/shm is small or shared with other jobs. xdist workers
+    receive the controller's basetemp and skip this.
+    """
+    if config.option.basetemp or "TMPDIR" in os.environ or os.environ.get("SPEC_KITTY_TEST_NO_TMPFS"):
+        return
+    if not sys.platform.startswith("linux") or not os.access(_SHM_DIR, os.W_OK):
+        return
+    if shutil.disk_usage(_SHM_DIR).free < _SHM_MIN_FREE:
+        return
+    # Like --basetemp: pytest clears this directory at the start of each run
+    config.option.basetemp = str(_SHM_DIR / f"spec-kitty-pytest-{os.getuid()}")
+
+
+def _disable_git_fsync() -> None:
+    """Append ``core.fsync=none`` to the env-provided git config (git >= 2.36).
+
+    Skipped when the key is already present, e.g. in xdist workers that
+    inherit the controller's environment.
+    """
+    index = int(os.environ.get("GIT_CONFIG_COUNT", "0"))
+    if any(os.environ.get(f"GIT_CONFIG_KEY_{i}") == "core.fsync" for i in range(index)):
+        return
+    _CONFIG_ENV.setenv(f"GIT_CONFIG_KEY_{index}", "core.fsync")
+    _CONFIG_ENV.setenv(f"GIT_CONFIG_VALUE_{index}", "none")
+    _CONFIG_ENV.setenv("GIT_CONFIG_COUNT", str(index + 1))
+
+
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers",
         "adversarial: adversarial scenarios for merge and dependency handling",
     )
+    # Test repositories are throwaway: keep their I/O in memory and skip fsync
+    _use_tmpfs_basetemp(config)
+    _disable_git_fsync()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    _CONFIG_ENV.undo()
 
 
 def _venv_python(venv_dir: Path) -> Path:
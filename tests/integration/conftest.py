@@ -10,10 +10,18 @@ from typing import Callable
 import pytest
 import yaml
 
-from tests.test_isolation_helpers import get_installed_version, get_venv_python
+from tests.test_isolation_helpers import get_installed_version, get_source_version, get_venv_python
+from tests.utils import close_commit_readers, copy_repo_template
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Isolation settings that do not depend on the caller's environment
+_ISOLATION_VARS = {
+    "PYTHONPATH": str(REPO_ROOT / "src"),  # Source only, no existing PYTHONPATH
+    "SPEC_KITTY_TEST_MODE": "1",  # Signal test mode (fail-fast on fixture bugs)
+    "SPEC_KITTY_TEMPLATE_ROOT": str(REPO_ROOT),  # Find bundled templates
+}
+
 
 @pytest.fixture()
 def isolated_env() -> dict[str, str]:
@@ -28,21 +36,10 @@ def isolated_env() -> dict[str, str]:
     This fixture guarantees that tests will never accidentally use a
     pip-installed version of spec-kitty-cli from the host system.
     """
+    # Copied per test: callers may mutate it, and os.environ may be patched
     env = os.environ.copy()
-    env.pop("PYTHONPATH", None)
-
-    # Single source of truth: pyproject.toml
-    with open(REPO_ROOT / "pyproject.toml", "rb") as f:
-        pyproject = tomllib.load(f)
-    source_version = pyproject["project"]["version"]
-
-    # Isolation settings
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = str(src_path)  # Source only, no existing PYTHONPATH
-    env["SPEC_KITTY_CLI_VERSION"] = source_version  # Override version detection
-    env["SPEC_KITTY_TEST_MODE"] = "1"  # Signal test mode (fail-fast on fixture bugs)
-    env["SPEC_KITTY_TEMPLATE_ROOT"] = str(REPO_ROOT)  # Find bundled templates
-
+    env.update(_ISOLATION_VARS)
+    env["SPEC_KITTY_CLI_VERSION"] = get_source_version()  # Override version detection
     return env
 
 
@@ -67,10 +64,14 @@ def run_cli(isolated_env: dict[str, str]) -> Callable[[Path, str], subprocess.Co
     return _run_cli
 
 
-@pytest.fixture()
-def test_project(tmp_path: Path) -> Path:
-    """Create a temporary Spec Kitty project with git initialized."""
-    project = tmp_path / "project"
+@pytest.fixture(scope="session")
+def _test_project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the committed Spec Kitty project once per session.
+
+    ``test_project`` copies this tree for each test instead of re-copying
+    ``.kittify`` and the missions and re-running git init/add/commit.
+    """
+    project = tmp_path_factory.mktemp("test_project_base") / "project"
     project.mkdir()
 
     shutil.copytree(
@@ -117,6 +118,12 @@ def test_project(tmp_path: Path) -> Path:
     return project
 
 
+@pytest.fixture()
+def test_project(tmp_path: Path, _test_project_template: Path) -> Path:
+    """Create a temporary Spec Kitty project with git initialized."""
+    return copy_repo_template(_test_project_template, tmp_path / "project")
+
+
 @pytest.fixture()
 def clean_project(test_project: Path) -> Path:
     """Return a clean git project with no worktrees."""
@@ -140,17 +147,14 @@ def project_with_worktree(test_project: Path) -> Path:
     return test_project
 
 
-@pytest.fixture()
-def dual_branch_repo(tmp_path: Path) -> Path:
-    """Create test repo with both main and 2.x branches.
+@pytest.fixture(scope="session")
+def _dual_branch_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the main + 2.x repository once per session.
 
-    Returns a repository with:
-    - main branch (initial commit)
-    - 2.x branch (branched from main)
-    - .kittify/ structure initialized
-    - Git configured for tests
+    ``dual_branch_repo`` copies this tree for each test, so the git init,
+    initial commit and metadata update run once instead of per test.
     """
-    repo = tmp_path / "repo"
+    repo = tmp_path_factory.mktemp("dual_branch_base") / "repo"
     repo.mkdir()
 
     # Copy .kittify structure
@@ -216,3 +220,23 @@ def dual_branch_repo(tmp_path: Path) -> Path:
             yaml.dump(metadata, f, default_flow_style=False, sort_keys=False)
 
     return repo
+
+
+@pytest.fixture()
+def dual_branch_repo(tmp_path: Path, _dual_branch_repo_template: Path) -> Path:
+    """Create test repo with both main and 2.x branches.
+
+    Returns a repository with:
+    - main branch (initial commit)
+    - 2.x branch (branched from main)
+    - .kittify/ structure initialized
+    - Git configured for tests
+    """
+    return copy_repo_template(_dual_branch_repo_template, tmp_path / "repo")
+
+
+@pytest.fixture(autouse=True)
+def _close_commit_readers():
+    """Shut down the cat-file processes a test started via ``commit_reader``."""
+    yield
+    close_commit_readers()
@@ -21,63 +21,60 @@ This test suite validates the detection and automation logic.
 
 from __future__ import annotations
 
-import json
-import os
+import re
 import subprocess
 from pathlib import Path
 
 import pytest
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from specify_cli.core.vcs import get_git_version
+from tests.test_isolation_helpers import run_cli_in_process
 
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
-    """Execute spec-kitty CLI."""
-    from tests.test_isolation_helpers import get_venv_python
+    """Execute spec-kitty CLI in-process (no interpreter start-up per call)."""
+    return run_cli_in_process(project_path, *args)
 
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(os.pathsep)
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
-    command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
-    return subprocess.run(command, cwd=str(project_path), capture_output=True, text=True, env=env)
+
+_WP_TEMPLATE = "---\nwork_package_id: {wp}\nlane: {lane}\n---\n\n# {wp}\n".format
+
+_MERGE_SUGGESTION = (
+    "{wp_id} depends on {deps} (all done).\n"
+    "Merge dependencies to main first to avoid conflicts?\n\n"
+    "Run: spec-kitty merge --feature <feature-slug>\n"
+    "Then: spec-kitty implement {wp_id}\n\n"
+    "Or use --force to attempt auto-merge (may conflict)"
+)
+
+
+def _load_lanes(wp_docs: dict[str, str], wp_ids: list[str]) -> dict[str, str]:
+    """Parse each WP's frontmatter once and map WP ID -> lane."""
+    from specify_cli.frontmatter import read_frontmatter_str
+
+    return {wp_id: read_frontmatter_str(wp_docs[wp_id])[0].get("lane") for wp_id in wp_ids}
 
 
 def test_detect_all_dependencies_done():
     """Test detection logic for when all dependencies are in done lane.
 
     Validates:
-    - Can read all WP files
+    - Can read all WP frontmatter
     - Can detect lane status
     - Can identify when ALL dependencies are done
     - Returns true/false correctly
     """
-    from specify_cli.frontmatter import read_frontmatter
-    import tempfile
-
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-
-        # Create WP files
-        for wp_id, lane in [("WP01", "done"), ("WP02", "done"), ("WP03", "done")]:
-            wp_file = tmp_path / f"{wp_id}.md"
-            wp_file.write_text(
-                f"---\n"
-                f"work_package_id: {wp_id}\n"
-                f"lane: {lane}\n"
-                f"---\n\n"
-                f"# {wp_id}\n"
-            )
-
-        # Check if all done
-        all_done = True
-        for wp_id in ["WP01", "WP02", "WP03"]:
-            frontmatter, _ = read_frontmatter(tmp_path / f"{wp_id}.md")
-            if frontmatter.get("lane") != "done":
-                all_done = False
-                break
-
-        assert all_done is True, "All dependencies should be detected as done"
+    # Create WP documents
+    wp_docs = {
+        wp_id: _WP_TEMPLATE(wp=wp_id, lane=lane)
+        for wp_id, lane in [("WP01", "done"), ("WP02", "done"), ("WP03", "done")]
+    }
+
+    # Check if all done
+    wp_ids = ["WP01", "WP02", "WP03"]
+    lanes = _load_lanes(wp_docs, wp_ids)
+    all_done = all(lanes[wp_id] == "done" for wp_id in wp_ids)
+
+    assert all_done is True, "All dependencies should be detected as done"
 
 
 def test_detect_partial_dependencies_done():
@@ -87,32 +84,18 @@ def test_detect_partial_dependencies_done():
     - Returns false when any dependency not done
     - Can distinguish between done, for_review, doing
     """
-    from specify_cli.frontmatter import read_frontmatter
-    import tempfile
-
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-
-        # Create WP files with mixed status
-        for wp_id, lane in [("WP01", "done"), ("WP02", "for_review"), ("WP03", "done")]:
-            wp_file = tmp_path / f"{wp_id}.md"
-            wp_file.write_text(
-                f"---\n"
-                f"work_package_id: {wp_id}\n"
-                f"lane: {lane}\n"
-                f"---\n\n"
-                f"# {wp_id}\n"
-            )
-
-        # Check if all done
-        all_done = True
-        for wp_id in ["WP01", "WP02", "WP03"]:
-            frontmatter, _ = read_frontmatter(tmp_path / f"{wp_id}.md")
-            if frontmatter.get("lane") != "done":
-                all_done = False
-                break
-
-        assert all_done is False, "Should detect that WP02 is not done"
+    # Create WP documents with mixed status
+    wp_docs = {
+        wp_id: _WP_TEMPLATE(wp=wp_id, lane=lane)
+        for wp_id, lane in [("WP01", "done"), ("WP02", "for_review"), ("WP03", "done")]
+    }
+
+    # Check if all done
+    wp_ids = ["WP01", "WP02", "WP03"]
+    lanes = _load_lanes(wp_docs, wp_ids)
+    all_done = all(lanes[wp_id] == "done" for wp_id in wp_ids)
+
+    assert all_done is False, "Should detect that WP02 is not done"
 
 
 def test_should_merge_dependencies_before_implement():
@@ -163,13 +146,7 @@ def test_merge_suggestion_message():
     deps = ["WP01", "WP02", "WP03"]
     wp_id = "WP04"
 
-    suggestion = (
-        f"{wp_id} depends on {', '.join(deps)} (all done).\n"
-        f"Merge dependencies to main first to avoid conflicts?\n\n"
-        f"Run: spec-kitty merge --feature <feature-slug>\n"
-        f"Then: spec-kitty implement {wp_id}\n\n"
-        f"Or use --force to attempt auto-merge (may conflict)"
-    )
+    suggestion = _MERGE_SUGGESTION.format_map({"wp_id": wp_id, "deps": ", ".join(deps)})
 
     assert "all done" in suggestion
     assert "spec-kitty merge" in suggestion
@@ -208,31 +185,103 @@ def test_auto_merge_dependencies_flag():
     assert "Create WP04 worktree from main" in expected_workflow[5]
 
 
-def test_conflict_prediction_dry_run():
+def _git_at_least(major: int, minor: int) -> bool:
+    """Return True if git is at least ``major.minor``; False if the version is unknown."""
+    match = re.match(r"(\d+)\.(\d+)", get_git_version() or "")
+    return match is not None and (int(match.group(1)), int(match.group(2))) >= (major, minor)
+
+
+def _init_conflicting_wp_repo(tmp_path: Path) -> Path:
+    """Create a repo where WP01-03 each conflict with main on .gitignore."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    git("init", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test User")
+    (repo / ".gitignore").write_text("*.pyc\n")
+    git("add", ".")
+    git("commit", "-m", "Initial commit")
+
+    # Each WP rewrites .gitignore; only WP02 adds package.json
+    for wp_id in ("WP01", "WP02", "WP03"):
+        git("checkout", "-b", wp_id, "main")
+        (repo / ".gitignore").write_text(f"*.pyc\n{wp_id.lower()}/\n")
+        if wp_id == "WP02":
+            (repo / "package.json").write_text("{}\n")
+        git("add", ".")
+        git("commit", "-m", f"{wp_id} changes")
+
+    # Main moves on too, so every WP conflicts with it on .gitignore
+    git("checkout", "main")
+    (repo / ".gitignore").write_text("*.pyc\nnode_modules/\n")
+    git("commit", "-am", "Ignore node_modules")
+
+    # A branch with no changes of its own merges cleanly
+    git("branch", "WP05", "main")
+    return repo
+
+
+@pytest.mark.skipif(not _git_at_least(2, 38), reason="git merge-tree --write-tree requires git 2.38+")
+def test_conflict_prediction_dry_run(tmp_path: Path):
     """Test that we could predict conflicts before attempting merge.
 
     Approach:
-    1. git merge-tree (no-commit merge simulation)
-    2. Check for conflict markers
+    1. git merge-tree --write-tree (in-memory merge, no worktree or index)
+    2. Collect the conflicted paths it reports
     3. Report: "WP01 and WP02 conflict on .gitignore"
     4. Suggest resolution strategy
 
     This would let agents know upfront which files will conflict.
     """
-    # This is a design test - documents proposed conflict prediction
+    from specify_cli.core.dependency_resolver import predict_merge_conflicts
 
-    # Example output:
-    predicted_conflicts = {
-        ".gitignore": ["WP01", "WP02", "WP03"],  # All three modify it
-        "package.json": ["WP02"],  # Only WP02 adds it
-    }
+    repo = _init_conflicting_wp_repo(tmp_path)
+
+    predicted_conflicts = predict_merge_conflicts(repo, ["WP01", "WP02", "WP03"], target="main")
 
     # Agent could then:
     # - Warn: ".gitignore conflicts in 3 WPs (requires manual resolution)"
     # - Suggest: "Merge WP01-03 to main first, or use --force"
 
-    assert ".gitignore" in predicted_conflicts
-    assert len(predicted_conflicts[".gitignore"]) == 3
+    assert predicted_conflicts == {".gitignore": ["WP01", "WP02", "WP03"]}
+    assert "package.json" not in predicted_conflicts
+
+
+@pytest.mark.skipif(not _git_at_least(2, 40), reason="git merge-tree --stdin requires git 2.40+")
+def test_conflict_prediction_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """All branches are simulated in one merge-tree --stdin process."""
+    from specify_cli.core.dependency_resolver import predict_merge_conflicts
+
+    repo = _init_conflicting_wp_repo(tmp_path)
+
+    merge_tree_calls: list[list[str]] = []
+    real_run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        if cmd[:2] == ["git", "merge-tree"]:
+            merge_tree_calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+
+    predicted_conflicts = predict_merge_conflicts(repo, ["WP01", "WP05", "WP03"], target="main")
+
+    assert predicted_conflicts == {".gitignore": ["WP01", "WP03"]}
+    assert len(merge_tree_calls) == 1
+    assert "--stdin" in merge_tree_calls[0]
+
+
+def test_conflict_prediction_bad_ref(tmp_path: Path):
+    """An unresolvable branch is reported as conflict-free, never raised."""
+    from specify_cli.core.dependency_resolver import predict_merge_conflicts
+
+    repo = _init_conflicting_wp_repo(tmp_path)
+
+    assert predict_merge_conflicts(repo, ["WP99"], target="main") == {}
 
 
 def test_recommendation_engine():
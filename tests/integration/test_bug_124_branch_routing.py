@@ -12,23 +12,17 @@ Scenario:
 from __future__ import annotations
 
 import json
-import os
 import subprocess
 from pathlib import Path
 
 import pytest
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from tests.test_isolation_helpers import get_venv_python, source_cli_env
 
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
     """Execute spec-kitty CLI."""
-    from tests.test_isolation_helpers import get_venv_python
-
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(os.pathsep)
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
+    env = source_cli_env()
     command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
     return subprocess.run(command, cwd=str(project_path), capture_output=True, text=True, env=env)
 
@@ -12,14 +12,11 @@ Tests the complete status commit routing logic for features with target_branch m
 from __future__ import annotations
 
 import json
-import os
 import subprocess
 from pathlib import Path
 
-import pytest
-
-# Get repo root for Python module invocation
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from tests.test_isolation_helpers import run_cli_in_process
+from tests.utils import GitFastImporter, commit_reader, write_files
 
 
 # ============================================================================
@@ -28,36 +25,50 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
-    """Execute spec-kitty CLI using Python module invocation."""
-    from tests.test_isolation_helpers import get_venv_python
+    """Execute spec-kitty CLI in-process (no interpreter start-up per call)."""
+    return run_cli_in_process(project_path, *args)
+
 
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(
-        os.pathsep
+def log_oneline(repo: Path, branch: str, limit: int | None = None) -> str:
+    """Render recent commits on ``branch`` like ``git log --oneline``."""
+    return "\n".join(
+        f"{sha[:7]} {subject}" for sha, subject in commit_reader(repo).log(branch, limit)
     )
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
-    command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
-    return subprocess.run(
-        command,
-        cwd=str(project_path),
+
+
+def current_branch(repo: Path) -> str:
+    """Return the branch HEAD points at."""
+    result = subprocess.run(
+        ["git", "symbolic-ref", "--short", "HEAD"],
+        cwd=repo,
+        check=True,
         capture_output=True,
         text=True,
-        env=env,
     )
+    return result.stdout.strip()
 
 
 def create_feature_with_target(
-    repo: Path, feature_slug: str, target_branch: str | None = None
+    repo: Path,
+    feature_slug: str,
+    target_branch: str | None = None,
+    importer: GitFastImporter | None = None,
 ) -> Path:
-    """Create feature directory with optional target_branch in meta.json."""
+    """Create feature directory with optional target_branch in meta.json.
+
+    The feature is committed to the current branch. Pass an ``importer`` to
+    batch the commit with further setup; otherwise it is flushed immediately.
+
+    Only the feature directory is committed, as the ``git add <feature_dir>``
+    this replaced did. ``dual_branch_repo`` leaves ``.kittify/metadata.yaml``
+    modified after its initial commit, so the CLI runs on that same dirty
+    tree. (``read_for_commit`` in the merged-dependency tests includes the
+    file because the setup it replaced used ``git add .``.)
+    """
     feature_dir = repo / "kitty-specs" / feature_slug
     tasks_dir = feature_dir / "tasks"
     tasks_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create spec.md
-    (feature_dir / "spec.md").write_text(f"# Spec for {feature_slug}\n")
-
     # Create meta.json with optional target_branch
     feature_number = feature_slug.split("-")[0]
     meta = {
@@ -69,80 +80,39 @@ def create_feature_with_target(
     if target_branch is not None:
         meta["target_branch"] = target_branch
 
-    (feature_dir / "meta.json").write_text(json.dumps(meta, indent=2) + "\n")
-
-    # Create WP01 file
-    wp_file = tasks_dir / "WP01-test.md"
-    wp_file.write_text(
-        "---\n"
-        "work_package_id: WP01\n"
-        "title: Test Work Package\n"
-        "lane: planned\n"
-        "dependencies: []\n"
-        "---\n\n"
-        "# WP01 Content\n"
+    files = write_files(
+        repo,
+        {
+            feature_dir / "spec.md": f"# Spec for {feature_slug}\n",
+            feature_dir / "meta.json": json.dumps(meta, indent=2) + "\n",
+            tasks_dir / "WP01-test.md": (
+                "---\n"
+                "work_package_id: WP01\n"
+                "title: Test Work Package\n"
+                "lane: planned\n"
+                "dependencies: []\n"
+                "---\n\n"
+                "# WP01 Content\n"
+            ),
+        },
     )
 
     # Commit to current branch
-    subprocess.run(["git", "add", str(feature_dir)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", f"Add {feature_slug}"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    branch = current_branch(repo)
+    git_import = importer or GitFastImporter(repo)
+    git_import.commit(branch, f"Add {feature_slug}", files)
+    if importer is None:
+        git_import.finish(head=branch)
 
     return feature_dir
 
 
-def get_last_commit_message(repo: Path, branch: str) -> str:
-    """Get the last commit message on a branch."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", "-1"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip()
-
-
 def assert_commit_on_branch(repo: Path, branch: str, expected_substring: str):
     """Assert that recent commit on branch contains expected substring."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", "-5"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    assert expected_substring in result.stdout, (
-        f"Expected '{expected_substring}' in recent commits on {branch}:\n{result.stdout}"
-    )
-
-
-def assert_no_commit_on_branch(repo: Path, branch: str, unexpected_substring: str):
-    """Assert that no recent commit on branch contains substring."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", "-10"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
+    recent = log_oneline(repo, branch, 5)
+    assert expected_substring in recent, (
+        f"Expected '{expected_substring}' in recent commits on {branch}:\n{recent}"
     )
-    assert unexpected_substring not in result.stdout, (
-        f"Unexpected '{unexpected_substring}' found in commits on {branch}:\n{result.stdout}"
-    )
-
-
-def verify_ancestry(repo: Path, ancestor: str, descendant: str) -> bool:
-    """Check if ancestor is an ancestor of descendant."""
-    result = subprocess.run(
-        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
-        cwd=repo,
-        capture_output=True,
-    )
-    return result.returncode == 0
 
 
 # ============================================================================
@@ -173,14 +143,7 @@ def test_status_routes_to_main_for_legacy_features(dual_branch_repo):
     assert_commit_on_branch(repo, "main", "Move WP01 to doing")
 
     # Verify 2.x branch unaffected (should only have initial commits)
-    result_2x = subprocess.run(
-        ["git", "log", "2.x", "--oneline"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    assert "WP01" not in result_2x.stdout, "Status commit leaked to 2.x branch"
+    assert "WP01" not in log_oneline(repo, "2.x"), "Status commit leaked to 2.x branch"
 
 
 def test_status_routes_to_2x_for_dual_branch_features(dual_branch_repo):
@@ -195,18 +158,15 @@ def test_status_routes_to_2x_for_dual_branch_features(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature on main WITH target_branch: "2.x"
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
-    feature_dir = create_feature_with_target(repo, "025-saas-feature", target_branch="2.x")
-
-    # Merge planning to 2.x (simulates real workflow where planning is on main first)
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    git_import = GitFastImporter(repo)
+    feature_dir = create_feature_with_target(
+        repo, "025-saas-feature", target_branch="2.x", importer=git_import
     )
 
+    # Fast-forward 2.x to the planning commit (simulates real workflow where planning is on main first)
+    git_import.fast_forward("2.x", "main")
+    git_import.finish(head="2.x")
+
     # STAY on 2.x for status operations (Bug #124: respect current branch)
     # (Previously test would checkout main, expecting auto-routing to 2.x)
 
@@ -221,16 +181,7 @@ def test_status_routes_to_2x_for_dual_branch_features(dual_branch_repo):
 
     # Verify main branch does NOT have this status commit
     # Main should only have the "Add 025-saas-feature" commit
-    result_main = subprocess.run(
-        ["git", "log", "main", "--oneline", "-5"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    # Extract just the commit messages
-    main_commits = [line.split(maxsplit=1)[1] for line in result_main.stdout.strip().split("\n") if line]
+    main_commits = [subject for _, subject in commit_reader(repo).log("main", 5)]
 
     # Should have feature creation commit but NOT status move commit
     assert any("Add 025-saas-feature" in msg for msg in main_commits), "Feature creation commit missing"
@@ -248,52 +199,33 @@ def test_status_routing_from_worktree_context(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature on main with target_branch: "2.x"
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
-    feature_dir = create_feature_with_target(repo, "026-worktree-test", target_branch="2.x")
-
-    # Merge to 2.x
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    git_import = GitFastImporter(repo)
+    feature_dir = create_feature_with_target(
+        repo, "026-worktree-test", target_branch="2.x", importer=git_import
     )
 
-    # Manually create a worktree for WP01 from 2.x
+    # Fast-forward 2.x to main
+    git_import.fast_forward("2.x", "main")
+
+    # Branch WP01 from 2.x, with a dummy commit to have something to review
     wp_branch = "026-worktree-test-WP01"
     worktree_path = repo / ".worktrees" / wp_branch
-
-    subprocess.run(
-        ["git", "worktree", "add", "-b", wp_branch, str(worktree_path), "2.x"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    git_import.branch(wp_branch, "2.x")
+    git_import.commit(wp_branch, "Add work", {"work.txt": b"some work"})
 
     # Update WP lane to doing (simulate starting work)
     wp_file = feature_dir / "tasks" / "WP01-test.md"
     content = wp_file.read_text()
     updated = content.replace('lane: planned', 'lane: doing')
-    wp_file.write_text(updated)
 
     # Commit the lane change to the WP file on 2.x (target branch)
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "add", str(wp_file)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Update WP01 to doing"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    git_import.commit("2.x", "Update WP01 to doing", write_files(repo, {wp_file: updated}))
+    git_import.finish(head="2.x")
 
-    # Now make a dummy commit in worktree to have something to review
-    dummy_file = worktree_path / "work.txt"
-    dummy_file.write_text("some work")
-    subprocess.run(["git", "add", "."], cwd=worktree_path, check=True, capture_output=True)
+    # Manually create the worktree for WP01 (fast-import does not do worktrees)
     subprocess.run(
-        ["git", "commit", "-m", "Add work"],
-        cwd=worktree_path,
+        ["git", "worktree", "add", str(worktree_path), wp_branch],
+        cwd=repo,
         check=True,
         capture_output=True,
     )
@@ -328,12 +260,14 @@ def test_mark_subtasks_routes_correctly(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature on main with target_branch: "2.x"
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
-    feature_dir = create_feature_with_target(repo, "027-subtask-test", target_branch="2.x")
+    git_import = GitFastImporter(repo)
+    feature_dir = create_feature_with_target(
+        repo, "027-subtask-test", target_branch="2.x", importer=git_import
+    )
 
     # Create tasks.md with subtasks (required by mark-status)
     tasks_md = feature_dir / "tasks.md"
-    tasks_md.write_text(
+    tasks_content = (
         "# Tasks\n\n"
         "## WP01 - Setup\n\n"
         "### Subtasks\n"
@@ -345,25 +279,14 @@ def test_mark_subtasks_routes_correctly(dual_branch_repo):
     wp_file = feature_dir / "tasks" / "WP01-test.md"
     content = wp_file.read_text()
     content += "\n## Subtasks\n- [ ] WP01.1 - First subtask\n- [ ] WP01.2 - Second subtask\n"
-    wp_file.write_text(content)
 
     # Commit the subtasks on main
-    subprocess.run(["git", "add", str(tasks_md), str(wp_file)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add subtasks to WP01"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    subtask_files = write_files(repo, {tasks_md: tasks_content, wp_file: content})
+    git_import.commit("main", "Add subtasks to WP01", subtask_files)
 
-    # Merge to 2.x
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    # Fast-forward 2.x to main
+    git_import.fast_forward("2.x", "main")
+    git_import.finish(head="2.x")
 
     # STAY on 2.x for CLI operations (Bug #124: respect current branch)
 
@@ -384,14 +307,7 @@ def test_mark_subtasks_routes_correctly(dual_branch_repo):
 
 def count_commits_matching(repo: Path, branch: str, pattern: str) -> int:
     """Count commits on branch matching pattern."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", "-20"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return sum(1 for line in result.stdout.split("\n") if pattern in line)
+    return sum(1 for line in log_oneline(repo, branch, 20).split("\n") if pattern in line)
 
 
 def test_race_condition_prevented(dual_branch_repo):
@@ -406,78 +322,45 @@ def test_race_condition_prevented(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature with target_branch: "2.x"
-    feature_dir = create_feature_with_target(repo, "028-race-test", target_branch="2.x")
-
-    # Merge feature files to 2.x so _ensure_target_branch_checked_out can find them
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
-        cwd=repo, check=True, capture_output=True,
+    git_import = GitFastImporter(repo)
+    feature_dir = create_feature_with_target(
+        repo, "028-race-test", target_branch="2.x", importer=git_import
     )
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
 
-    # Checkout 2.x and create implementation branch
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
+    # Merge feature files to 2.x so _ensure_target_branch_checked_out can find them
+    git_import.merge("2.x", "main", "Merge planning from main")
 
+    # Create implementation branch from 2.x with an implementation commit
     wp_branch = "028-race-test-WP01"
     worktree_path = repo / ".worktrees" / wp_branch
+    git_import.branch(wp_branch, "2.x")
+    git_import.commit(wp_branch, "Implement WP01", {"implementation.txt": b"implementation work\n"})
+    git_import.finish(head="main")
 
     subprocess.run(
-        ["git", "worktree", "add", "-b", wp_branch, str(worktree_path), "2.x"],
+        ["git", "worktree", "add", str(worktree_path), wp_branch],
         cwd=repo,
         check=True,
         capture_output=True,
     )
 
-    # Make implementation commit in worktree
-    test_file = worktree_path / "implementation.txt"
-    test_file.write_text("implementation work\n")
-    subprocess.run(["git", "add", "."], cwd=worktree_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Implement WP01"],
-        cwd=worktree_path,
-        check=True,
-        capture_output=True,
-    )
-
     # Get WP branch HEAD before status commit
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    wp_branch_head_before = result.stdout.strip()
+    reader = commit_reader(repo)
+    wp_branch_head_before = reader.resolve(wp_branch)
 
     # Move to doing (status commit to 2.x)
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
     result = run_cli(repo, "agent", "tasks", "move-task", "WP01", "--to", "doing")
     assert result.returncode == 0, f"Failed to move task: {result.stderr}"
 
     # Get WP branch HEAD after status commit
-    result = subprocess.run(
-        ["git", "rev-parse", wp_branch],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    wp_branch_head_after = result.stdout.strip()
+    wp_branch_head_after = reader.resolve(wp_branch)
 
     # WP branch HEAD should be unchanged (implementation branch not affected by status commit)
     assert wp_branch_head_before == wp_branch_head_after, "WP branch should not be modified by status commit"
 
     # Verify shared ancestry: 2.x and WP branch should share a common ancestor
     # (status commits advance 2.x but WP branch fork point is still valid)
-    merge_base = subprocess.run(
-        ["git", "merge-base", "2.x", wp_branch],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    assert merge_base.stdout.strip(), "2.x and WP branch should share a common ancestor (no race condition)"
+    assert reader.merge_base("2.x", wp_branch), "2.x and WP branch should share a common ancestor (no race condition)"
 
     # Cleanup
     subprocess.run(
@@ -534,14 +417,13 @@ def test_migration_detection_and_routing(dual_branch_repo):
 
     # Run migration (simulated - just add target_branch: "main")
     meta["target_branch"] = "main"
-    meta_file.write_text(json.dumps(meta, indent=2) + "\n")
-    subprocess.run(["git", "add", str(meta_file)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Migration: Add target_branch to 030"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    git_import = GitFastImporter(repo)
+    git_import.commit(
+        "main",
+        "Migration: Add target_branch to 030",
+        write_files(repo, {meta_file: json.dumps(meta, indent=2) + "\n"}),
     )
+    git_import.finish(head="main")
 
     # Now move task (should route to main)
     result = run_cli(repo, "agent", "tasks", "move-task", "WP01", "--to", "doing")
@@ -551,16 +433,6 @@ def test_migration_detection_and_routing(dual_branch_repo):
     assert_commit_on_branch(repo, "main", "Move WP01 to doing")
 
 
-def verify_ancestry(repo: Path, ancestor: str, descendant: str) -> bool:
-    """Check if ancestor is an ancestor of descendant."""
-    result = subprocess.run(
-        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
-        cwd=repo,
-        capture_output=True,
-    )
-    return result.returncode == 0
-
-
 # ============================================================================
 # Additional Edge Cases
 # ============================================================================
@@ -578,14 +450,11 @@ def test_multiple_lane_transitions_same_target(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature on main with target_branch: "2.x"
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
-
     feature_dir = repo / "kitty-specs" / "031-multi-transition"
     tasks_dir = feature_dir / "tasks"
     tasks_dir.mkdir(parents=True, exist_ok=True)
 
     # Create spec and meta
-    (feature_dir / "spec.md").write_text("# Multi-transition test\n")
     meta = {
         "feature_number": "031",
         "feature_slug": "031-multi-transition",
@@ -593,13 +462,15 @@ def test_multiple_lane_transitions_same_target(dual_branch_repo):
         "created_at": "2026-01-29T00:00:00Z",
         "vcs": "git",
     }
-    (feature_dir / "meta.json").write_text(json.dumps(meta, indent=2) + "\n")
+    feature_files = {
+        feature_dir / "spec.md": "# Multi-transition test\n",
+        feature_dir / "meta.json": json.dumps(meta, indent=2) + "\n",
+    }
 
     # Create three WP files
     for wp_num in range(1, 4):
         wp_id = f"WP0{wp_num}"
-        wp_file = tasks_dir / f"{wp_id}-test.md"
-        wp_file.write_text(
+        feature_files[tasks_dir / f"{wp_id}-test.md"] = (
             f"---\n"
             f"work_package_id: {wp_id}\n"
             f"title: Test {wp_id}\n"
@@ -609,23 +480,11 @@ def test_multiple_lane_transitions_same_target(dual_branch_repo):
             f"# {wp_id}\n"
         )
 
-    # Commit to main
-    subprocess.run(["git", "add", str(feature_dir)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add 031-multi-transition"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    # Merge to 2.x
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    # Commit to main, then fast-forward 2.x
+    git_import = GitFastImporter(repo)
+    git_import.commit("main", "Add 031-multi-transition", write_files(repo, feature_files))
+    git_import.fast_forward("2.x", "main")
+    git_import.finish(head="2.x")
 
     # STAY on 2.x for all status operations (Bug #124: respect current branch)
 
@@ -646,14 +505,7 @@ def test_multiple_lane_transitions_same_target(dual_branch_repo):
 
 def get_commits_on_branch(repo: Path, branch: str, limit: int = 20) -> list[str]:
     """Get commit messages on a branch."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", f"-{limit}"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip().split("\n") if result.stdout.strip() else []
+    return log_oneline(repo, branch, limit).split("\n")
 
 
 def test_target_branch_detection_from_worktree_path(dual_branch_repo):
@@ -667,23 +519,21 @@ def test_target_branch_detection_from_worktree_path(dual_branch_repo):
     repo = dual_branch_repo
 
     # Create feature on main with target_branch: "2.x"
-    subprocess.run(["git", "checkout", "main"], cwd=repo, check=True, capture_output=True)
-    feature_dir = create_feature_with_target(repo, "032-worktree-detection", target_branch="2.x")
-
-    # Merge to 2.x
-    subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    git_import = GitFastImporter(repo)
+    feature_dir = create_feature_with_target(
+        repo, "032-worktree-detection", target_branch="2.x", importer=git_import
     )
 
-    # Create worktree from 2.x (for context, but we won't run command from it)
+    # Fast-forward 2.x to main and branch WP01 from it
     wp_branch = "032-worktree-detection-WP01"
+    git_import.fast_forward("2.x", "main")
+    git_import.branch(wp_branch, "2.x")
+    git_import.finish(head="2.x")
+
+    # Create worktree for WP01 (for context, but we won't run command from it)
     worktree_path = repo / ".worktrees" / wp_branch
     subprocess.run(
-        ["git", "worktree", "add", "-b", wp_branch, str(worktree_path), "2.x"],
+        ["git", "worktree", "add", str(worktree_path), wp_branch],
         cwd=repo,
         check=True,
         capture_output=True,
@@ -13,14 +13,13 @@ This test replicates the complete Feature 025 scenario:
 from __future__ import annotations
 
 import json
-import os
 import subprocess
 from pathlib import Path
 
 import pytest
 
-# Get repo root for Python module invocation
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from tests.test_isolation_helpers import get_venv_python, source_cli_env
+from tests.utils import commit_reader
 
 
 # ============================================================================
@@ -30,14 +29,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
     """Execute spec-kitty CLI using Python module invocation."""
-    from tests.test_isolation_helpers import get_venv_python
-
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(
-        os.pathsep
-    )
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
+    env = source_cli_env()
     command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
     return subprocess.run(
         command,
@@ -49,15 +41,8 @@ def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
 
 
 def get_commits_on_branch(repo: Path, branch: str, limit: int = 20) -> list[str]:
-    """Get commit messages on a branch."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", f"-{limit}"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip().split("\n") if result.stdout.strip() else []
+    """Get commit messages on a branch (``git log --oneline`` format)."""
+    return [f"{sha[:7]} {subject}" for sha, subject in commit_reader(repo).log(branch, limit)]
 
 
 def count_commits_matching(repo: Path, branch: str, pattern: str) -> int:
@@ -68,12 +53,9 @@ def count_commits_matching(repo: Path, branch: str, pattern: str) -> int:
 
 def verify_ancestry(repo: Path, ancestor: str, descendant: str) -> bool:
     """Check if ancestor is an ancestor of descendant."""
-    result = subprocess.run(
-        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
-        cwd=repo,
-        capture_output=True,
-    )
-    return result.returncode == 0
+    reader = commit_reader(repo)
+    ancestor_sha = reader.resolve(ancestor)
+    return any(sha == ancestor_sha for sha, _ in reader.log(descendant))
 
 
 # ============================================================================
@@ -188,10 +170,10 @@ It is NOT part of the 1.x product line.
     # Record commit count on main after planning
     main_commits_after_planning = get_commits_on_branch(repo, "main")
 
-    # Merge planning to 2.x (required for status commits to work on 2.x)
+    # Fast-forward 2.x to the planning commit (required for status commits to work on 2.x)
     subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
     subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
+        ["git", "merge", "--ff-only", "main"],
         cwd=repo,
         check=True,
         capture_output=True,
@@ -287,25 +269,13 @@ It is NOT part of the 1.x product line.
     assert not status_on_main, "Main should not have status commits for 2.x features"
 
     # Verify WP01 branch and 2.x share common history (merge-base exists)
-    result = subprocess.run(
-        ["git", "merge-base", "2.x", wp01_branch],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    merge_base = result.stdout.strip()
+    reader = commit_reader(repo)
+    merge_base = reader.merge_base("2.x", wp01_branch)
     assert merge_base, "WP01 and 2.x should share common history"
 
     # WP01 branch should have implementation commits
-    result = subprocess.run(
-        ["git", "rev-list", "--count", f"{merge_base}..{wp01_branch}"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    impl_commits = int(result.stdout.strip())
+    base_history = {sha for sha, _ in reader.log(merge_base)}
+    impl_commits = sum(1 for sha, _ in reader.log(wp01_branch) if sha not in base_history)
     assert impl_commits > 0, "WP01 should have implementation commits"
 
     # ========================================================================
@@ -341,44 +311,10 @@ It is NOT part of the 1.x product line.
 
 def assert_commit_on_branch(repo: Path, branch: str, expected_substring: str):
     """Assert that recent commit on branch contains expected substring."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", "-5"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    assert expected_substring in result.stdout, (
-        f"Expected '{expected_substring}' in recent commits on {branch}:\n{result.stdout}"
-    )
-
-
-def get_commits_on_branch(repo: Path, branch: str, limit: int = 20) -> list[str]:
-    """Get commit messages on a branch."""
-    result = subprocess.run(
-        ["git", "log", branch, "--oneline", f"-{limit}"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip().split("\n") if result.stdout.strip() else []
-
-
-def count_commits_matching(repo: Path, branch: str, pattern: str) -> int:
-    """Count commits on branch matching pattern."""
-    commits = get_commits_on_branch(repo, branch)
-    return sum(1 for commit in commits if pattern in commit)
-
-
-def verify_ancestry(repo: Path, ancestor: str, descendant: str) -> bool:
-    """Check if ancestor is an ancestor of descendant."""
-    result = subprocess.run(
-        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
-        cwd=repo,
-        capture_output=True,
+    recent = "\n".join(get_commits_on_branch(repo, branch, 5))
+    assert expected_substring in recent, (
+        f"Expected '{expected_substring}' in recent commits on {branch}:\n{recent}"
     )
-    return result.returncode == 0
 
 
 # ============================================================================
@@ -452,10 +388,10 @@ def test_wp02_depends_on_wp01_with_2x_target(dual_branch_repo):
         capture_output=True,
     )
 
-    # Merge planning to 2.x (required for status commits to work on 2.x)
+    # Fast-forward 2.x to the planning commit (required for status commits to work on 2.x)
     subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
     subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning from main"],
+        ["git", "merge", "--ff-only", "main"],
         cwd=repo,
         check=True,
         capture_output=True,
@@ -556,10 +492,10 @@ def test_review_rework_commits_to_correct_branch(dual_branch_repo):
         capture_output=True,
     )
 
-    # Merge planning to 2.x
+    # Fast-forward 2.x to the planning commit
     subprocess.run(["git", "checkout", "2.x"], cwd=repo, check=True, capture_output=True)
     subprocess.run(
-        ["git", "merge", "main", "--no-ff", "-m", "Merge planning"],
+        ["git", "merge", "--ff-only", "main"],
         cwd=repo,
         check=True,
         capture_output=True,
@@ -10,17 +10,20 @@ import subprocess
 from pathlib import Path
 
 import pytest
-from typer.testing import CliRunner
 
 from specify_cli.cli.commands.agent.feature import app
+from tests.test_isolation_helpers import invoke_cli_in_process
+from tests.utils import copy_repo_template
 
-runner = CliRunner()
 
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initial-commit repository once per session.
 
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing."""
-    repo = tmp_path / "test-repo"
+    ``git_repo`` copies this tree for each test instead of re-running
+    git init/config/add/commit.
+    """
+    repo = tmp_path_factory.mktemp("feature_commands_base") / "test-repo"
     repo.mkdir()
 
     # Initialize git repo
@@ -55,6 +58,12 @@ def git_repo(tmp_path: Path) -> Path:
     return repo
 
 
+@pytest.fixture
+def git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a temporary git repository for testing."""
+    return copy_repo_template(_git_repo_template, tmp_path / "test-repo")
+
+
 class TestCreateFeatureIntegration:
     """Integration tests for create-feature command."""
 
@@ -78,10 +87,10 @@ class TestCreateFeatureIntegration:
         (git_repo / ".kittify" / "AGENTS.md").write_text("# Agents")
 
         # Execute
-        result = runner.invoke(app, ["create-feature", "test-feature", "--json"])
+        result = invoke_cli_in_process(app, ["create-feature", "test-feature", "--json"])
 
         # Verify command succeeded
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         assert output["result"] == "success"
         assert output["feature"] == "001-test-feature"
@@ -123,14 +132,14 @@ class TestCreateFeatureIntegration:
         (template_dir / "spec-template.md").write_text("# Spec")
 
         # Create first feature
-        result1 = runner.invoke(app, ["create-feature", "feature-one", "--json"])
-        assert result1.exit_code == 0
+        result1 = invoke_cli_in_process(app, ["create-feature", "feature-one", "--json"])
+        assert result1.returncode == 0
         output1 = json.loads(result1.stdout)
         assert output1["feature"] == "001-feature-one"
 
         # Create second feature
-        result2 = runner.invoke(app, ["create-feature", "feature-two", "--json"])
-        assert result2.exit_code == 0
+        result2 = invoke_cli_in_process(app, ["create-feature", "feature-two", "--json"])
+        assert result2.returncode == 0
         output2 = json.loads(result2.stdout)
         assert output2["feature"] == "002-feature-two"
 
@@ -157,8 +166,8 @@ class TestCreateFeatureIntegration:
         monkeypatch.chdir(worktree_path)
 
         # Create feature from worktree should fail (must be in planning repo, not worktree)
-        result = runner.invoke(app, ["create-feature", "second-feature", "--json"])
-        assert result.exit_code != 0
+        result = invoke_cli_in_process(app, ["create-feature", "second-feature", "--json"])
+        assert result.returncode != 0
         error_output = result.stdout + result.stderr
         assert "worktree" in error_output.lower()
 
@@ -174,17 +183,17 @@ class TestCheckPrerequisitesIntegration:
         template_dir.mkdir(parents=True)
         (template_dir / "spec-template.md").write_text("# Spec")
 
-        runner.invoke(app, ["create-feature", "test-feature"])
+        invoke_cli_in_process(app, ["create-feature", "test-feature"])
 
         # Change to feature directory (main repo)
         feature_dir = git_repo / "kitty-specs" / "001-test-feature"
         monkeypatch.chdir(feature_dir)
 
         # Execute
-        result = runner.invoke(app, ["check-prerequisites", "--json"])
+        result = invoke_cli_in_process(app, ["check-prerequisites", "--json"])
 
         # Verify
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         assert output["valid"] is True
         assert output["errors"] == []
@@ -199,10 +208,10 @@ class TestCheckPrerequisitesIntegration:
         feature_dir.mkdir(parents=True)
 
         # Execute
-        result = runner.invoke(app, ["check-prerequisites", "--json"])
+        result = invoke_cli_in_process(app, ["check-prerequisites", "--json"])
 
         # Verify
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         assert output["valid"] is False
         assert any("spec.md" in error for error in output["errors"])
@@ -216,18 +225,18 @@ class TestCheckPrerequisitesIntegration:
         (template_dir / "spec-template.md").write_text("# Spec")
 
         # Create multiple features
-        runner.invoke(app, ["create-feature", "feature-one"])
-        runner.invoke(app, ["create-feature", "feature-two"])
+        invoke_cli_in_process(app, ["create-feature", "feature-one"])
+        invoke_cli_in_process(app, ["create-feature", "feature-two"])
 
         # Change to second feature directory
         feature_dir = git_repo / "kitty-specs" / "002-feature-two"
         monkeypatch.chdir(feature_dir)
 
         # Execute
-        result = runner.invoke(app, ["check-prerequisites", "--json"])
+        result = invoke_cli_in_process(app, ["check-prerequisites", "--json"])
 
         # Verify it detects the correct feature (002, not 001)
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         assert "002-feature-two" in output["paths"]["feature_dir"]
 
@@ -240,10 +249,10 @@ class TestCheckPrerequisitesIntegration:
         (feature_dir / "spec.md").write_text("# Spec")
 
         # Execute
-        result = runner.invoke(app, ["check-prerequisites", "--json", "--paths-only"])
+        result = invoke_cli_in_process(app, ["check-prerequisites", "--json", "--paths-only"])
 
         # Verify
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         # Should only have paths, not valid/errors/warnings
         assert "spec_file" in output
@@ -271,10 +280,10 @@ class TestSetupPlanIntegration:
         (template_dir / "plan-template.md").write_text(plan_template_content)
 
         # Execute
-        result = runner.invoke(app, ["setup-plan", "--json"])
+        result = invoke_cli_in_process(app, ["setup-plan", "--json"])
 
         # Verify
-        assert result.exit_code == 0
+        assert result.returncode == 0
         output = json.loads(result.stdout)
         assert output["result"] == "success"
 
@@ -293,7 +302,7 @@ class TestSetupPlanIntegration:
         (template_dir / "plan-template.md").write_text("# Plan Template")
 
         # Create feature
-        runner.invoke(app, ["create-feature", "test-feature"])
+        invoke_cli_in_process(app, ["create-feature", "test-feature"])
 
         # Change to feature directory
         feature_dir = git_repo / "kitty-specs" / "001-test-feature"
@@ -305,10 +314,10 @@ class TestSetupPlanIntegration:
             plan_file.unlink()
 
         # Execute
-        result = runner.invoke(app, ["setup-plan", "--json"])
+        result = invoke_cli_in_process(app, ["setup-plan", "--json"])
 
         # Verify
-        assert result.exit_code == 0, f"Command failed: {result.stdout}"
+        assert result.returncode == 0, f"Command failed: {result.stdout}"
         assert plan_file.exists()
         assert plan_file.read_text() == "# Plan Template"
 
@@ -325,10 +334,10 @@ class TestSetupPlanIntegration:
         assert not (git_repo / ".kittify" / "templates" / "plan-template.md").exists()
 
         # Execute
-        result = runner.invoke(app, ["setup-plan", "--json"])
+        result = invoke_cli_in_process(app, ["setup-plan", "--json"])
 
         # Verify
-        assert result.exit_code == 0, f"Command failed: {result.stdout}"
+        assert result.returncode == 0, f"Command failed: {result.stdout}"
         assert plan_file.exists()
         assert plan_file.read_text().startswith("# Implementation Plan:")
 
@@ -348,15 +357,15 @@ class TestEndToEndFeatureWorkflow:
         (template_dir / "plan-template.md").write_text("# Plan")
 
         # Step 1: Create feature
-        result1 = runner.invoke(app, ["create-feature", "new-feature", "--json"])
-        assert result1.exit_code == 0
+        result1 = invoke_cli_in_process(app, ["create-feature", "new-feature", "--json"])
+        assert result1.returncode == 0
         output1 = json.loads(result1.stdout)
         feature_dir = Path(output1["feature_dir"])
 
         # Step 2: Check prerequisites from feature directory
         monkeypatch.chdir(feature_dir)
-        result2 = runner.invoke(app, ["check-prerequisites", "--json"])
-        assert result2.exit_code == 0
+        result2 = invoke_cli_in_process(app, ["check-prerequisites", "--json"])
+        assert result2.returncode == 0
         output2 = json.loads(result2.stdout)
         assert output2["valid"] is True
 
@@ -365,8 +374,8 @@ class TestEndToEndFeatureWorkflow:
         if plan_file.exists():
             plan_file.unlink()
 
-        result3 = runner.invoke(app, ["setup-plan", "--json"])
-        assert result3.exit_code == 0, f"Setup plan failed: {result3.stdout}"
+        result3 = invoke_cli_in_process(app, ["setup-plan", "--json"])
+        assert result3.returncode == 0, f"Setup plan failed: {result3.stdout}"
 
         # Verify final state
         assert plan_file.exists()
@@ -374,8 +383,8 @@ class TestEndToEndFeatureWorkflow:
 
         # Verify we can check prerequisites with tasks
         (feature_dir / "tasks.md").write_text("# Tasks")
-        result4 = runner.invoke(app, ["check-prerequisites", "--include-tasks", "--json"])
-        assert result4.exit_code == 0
+        result4 = invoke_cli_in_process(app, ["check-prerequisites", "--include-tasks", "--json"])
+        assert result4.returncode == 0
         output4 = json.loads(result4.stdout)
         assert output4["valid"] is True
         assert "tasks_file" in output4["paths"]
@@ -7,54 +7,46 @@ preventing agent confusion when unrelated files are dirty.
 from __future__ import annotations
 
 import json
-import os
+import re
 import subprocess
 from pathlib import Path
 
 import pytest
 
-# Get repo root for Python module invocation
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from tests.test_isolation_helpers import run_cli_in_process
+from tests.utils import GIT_QUIET, commit_reader, copy_repo_template
+
+
+# Fixed .kittify contents; written verbatim rather than serialized with PyYAML.
+_CONFIG_YAML = "agents:\n  available:\n  - claude\nvcs:\n  type: git\n"
+_METADATA_YAML = "spec_kitty:\n  version: 0.13.8\n"
+
+_SHA1_RE = re.compile(r"[0-9a-f]{40}")
 
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
-    """Execute spec-kitty CLI using Python module invocation."""
-    from tests.test_isolation_helpers import get_venv_python
+    """Execute spec-kitty CLI in-process (no interpreter start-up per call)."""
+    return run_cli_in_process(project_path, *args)
 
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(
-        os.pathsep
-    )
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
-    command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
-    return subprocess.run(
-        command,
-        cwd=str(project_path),
-        capture_output=True,
-        text=True,
-        env=env,
-    )
+
+def init_git_repo(repo: Path) -> None:
+    """Initialize ``repo`` on ``main`` with a test identity in one git process.
+
+    The identity is appended to ``.git/config`` directly rather than through
+    two more ``git config`` invocations.
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=repo, **GIT_QUIET)
+    with (repo / ".git" / "config").open("a", encoding="utf-8") as config:
+        config.write("[user]\n\tname = Test\n\temail = test@test.com\n")
 
 
 def create_test_feature(repo: Path) -> Path:
     """Create minimal feature with tasks for testing."""
-    import yaml
-
     # Create .kittify structure
     kittify = repo / ".kittify"
     kittify.mkdir(exist_ok=True)
-
-    config = {
-        "vcs": {"type": "git"},
-        "agents": {"available": ["claude"]}
-    }
-    (kittify / "config.yaml").write_text(yaml.dump(config))
-
-    metadata = {
-        "spec_kitty": {"version": "0.13.8"}
-    }
-    (kittify / "metadata.yaml").write_text(yaml.dump(metadata))
+    (kittify / "config.yaml").write_text(_CONFIG_YAML)
+    (kittify / "metadata.yaml").write_text(_METADATA_YAML)
 
     # Create feature
     feature_dir = repo / "kitty-specs/001-test-feature"
@@ -88,18 +80,33 @@ def create_test_feature(repo: Path) -> Path:
         )
 
     # Commit base state
-    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial feature"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    subprocess.run(["git", "add", "."], cwd=repo, **GIT_QUIET)
+    subprocess.run(["git", "commit", "-m", "Initial feature"], cwd=repo, **GIT_QUIET)
 
     return feature_dir
 
 
-def test_finalize_tasks_json_includes_commit_hash(tmp_path):
+@pytest.fixture(scope="session")
+def _finalize_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the committed feature repository once per session.
+
+    ``finalize_repo`` copies this tree for each test instead of re-running
+    git init and ``create_test_feature``.
+    """
+    repo = tmp_path_factory.mktemp("finalize_tasks_base") / "repo"
+    repo.mkdir()
+    init_git_repo(repo)
+    create_test_feature(repo)
+    return repo
+
+
+@pytest.fixture
+def finalize_repo(tmp_path: Path, _finalize_repo_template: Path) -> Path:
+    """Return a fresh copy of the feature repository for one test."""
+    return copy_repo_template(_finalize_repo_template, tmp_path / "repo")
+
+
+def test_finalize_tasks_json_includes_commit_hash(finalize_repo):
     """Test that finalize-tasks JSON output includes commit hash.
 
     Validates:
@@ -107,24 +114,7 @@ def test_finalize_tasks_json_includes_commit_hash(tmp_path):
     - Hash is valid git SHA (40 chars hex)
     - Hash matches actual HEAD after command
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Run finalize-tasks
     result = run_cli(repo, "agent", "feature", "finalize-tasks", "--json")
@@ -139,23 +129,15 @@ def test_finalize_tasks_json_includes_commit_hash(tmp_path):
 
     # Verify hash is valid SHA
     commit_hash = output["commit_hash"]
-    assert len(commit_hash) == 40, "commit_hash should be 40-char SHA"
-    assert all(c in "0123456789abcdef" for c in commit_hash), "commit_hash should be hex"
+    assert _SHA1_RE.fullmatch(commit_hash), "commit_hash should be 40-char hex SHA"
 
     # Verify hash matches actual HEAD
-    result_head = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    actual_head = result_head.stdout.strip()
+    actual_head = commit_reader(repo).resolve("HEAD")
 
     assert commit_hash == actual_head, "commit_hash should match git HEAD"
 
 
-def test_finalize_tasks_json_includes_commit_created_flag(tmp_path):
+def test_finalize_tasks_json_includes_commit_created_flag(finalize_repo):
     """Test that finalize-tasks JSON output includes commit_created boolean.
 
     Validates:
@@ -163,24 +145,7 @@ def test_finalize_tasks_json_includes_commit_created_flag(tmp_path):
     - Value is true when files are committed
     - Value is false when nothing to commit
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Run finalize-tasks (should create commit)
     result = run_cli(repo, "agent", "feature", "finalize-tasks", "--json")
@@ -203,7 +168,7 @@ def test_finalize_tasks_json_includes_commit_created_flag(tmp_path):
     assert output2["commit_created"] is False, "Should not create commit on second run"
 
 
-def test_finalize_tasks_json_includes_files_committed(tmp_path):
+def test_finalize_tasks_json_includes_files_committed(finalize_repo):
     """Test that finalize-tasks JSON output lists files committed.
 
     Validates:
@@ -211,24 +176,7 @@ def test_finalize_tasks_json_includes_files_committed(tmp_path):
     - List includes tasks.md and WP files
     - Paths are relative to repo root
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Run finalize-tasks
     result = run_cli(repo, "agent", "feature", "finalize-tasks", "--json")
@@ -247,7 +195,7 @@ def test_finalize_tasks_json_includes_files_committed(tmp_path):
     assert any("WP02" in f for f in files), "Should include WP02 file"
 
 
-def test_finalize_tasks_with_unrelated_dirty_files(tmp_path):
+def test_finalize_tasks_with_unrelated_dirty_files(finalize_repo):
     """Test that finalize-tasks succeeds despite unrelated dirty files.
 
     This replicates the confusion from ~/tmp where template deletions
@@ -258,24 +206,7 @@ def test_finalize_tasks_with_unrelated_dirty_files(tmp_path):
     - JSON clearly shows commit_created: true
     - Agent can distinguish between committed tasks vs dirty templates
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Create unrelated dirty files (simulating template deletions)
     templates_dir = repo / ".kittify/templates"
@@ -285,13 +216,8 @@ def test_finalize_tasks_with_unrelated_dirty_files(tmp_path):
     for i in range(5):
         (templates_dir / f"template{i}.md").write_text(f"Template {i}\n")
 
-    subprocess.run(["git", "add", str(templates_dir)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add templates"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    subprocess.run(["git", "add", str(templates_dir)], cwd=repo, **GIT_QUIET)
+    subprocess.run(["git", "commit", "-m", "Add templates"], cwd=repo, **GIT_QUIET)
 
     # Now delete them (making them dirty - but don't commit)
     for i in range(5):
@@ -317,17 +243,7 @@ def test_finalize_tasks_with_unrelated_dirty_files(tmp_path):
     assert output["commit_created"] is True, "Should create commit for tasks despite dirty templates"
     assert output["commit_hash"] is not None, "Should have commit hash"
 
-    # Verify tasks are actually committed
-    tasks_status = subprocess.run(
-        ["git", "status", "kitty-specs/"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    assert "nothing to commit" in tasks_status.stdout, "Tasks should be committed"
-
-    # Verify templates are still dirty (unrelated)
+    # One status read covers both checks below
     overall_status = subprocess.run(
         ["git", "status", "--porcelain"],
         cwd=repo,
@@ -335,10 +251,17 @@ def test_finalize_tasks_with_unrelated_dirty_files(tmp_path):
         text=True,
         check=True,
     )
+
+    # Verify tasks are actually committed
+    assert not any(
+        line[3:].startswith("kitty-specs/") for line in overall_status.stdout.splitlines()
+    ), "Tasks should be committed"
+
+    # Verify templates are still dirty (unrelated)
     assert " D " in overall_status.stdout, "Templates should still be dirty (separate concern)"
 
 
-def test_json_output_prevents_agent_confusion(tmp_path):
+def test_json_output_prevents_agent_confusion(finalize_repo):
     """Test that improved JSON output prevents agent from committing twice.
 
     This test documents the fix for the confusion observed in ~/tmp.
@@ -355,34 +278,10 @@ def test_json_output_prevents_agent_confusion(tmp_path):
     - Agent knows files are committed (explicit confirmation)
     - Agent doesn't commit again
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Get HEAD before finalize-tasks
-    result_before = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    head_before = result_before.stdout.strip()
+    head_before = commit_reader(repo).resolve("HEAD")
 
     # Run finalize-tasks
     result = run_cli(repo, "agent", "feature", "finalize-tasks", "--json")
@@ -391,14 +290,7 @@ def test_json_output_prevents_agent_confusion(tmp_path):
     output = json.loads(result.stdout)
 
     # Get HEAD after finalize-tasks
-    result_after = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    head_after = result_after.stdout.strip()
+    head_after = commit_reader(repo).resolve("HEAD")
 
     # Verify commit was created
     assert head_before != head_after, "HEAD should advance (commit created)"
@@ -413,18 +305,11 @@ def test_json_output_prevents_agent_confusion(tmp_path):
     # Agent can now check: if commit_created == true, don't commit again
     if output["commit_created"]:
         # Files are committed, verify with commit_hash
-        verify_result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        assert verify_result.stdout.strip() == output["commit_hash"]
+        assert commit_reader(repo).resolve("HEAD") == output["commit_hash"]
         # Don't run git commit again!
 
 
-def test_json_output_schema_complete(tmp_path):
+def test_json_output_schema_complete(finalize_repo):
     """Test that JSON output has all expected fields for agent decision-making.
 
     Required fields:
@@ -435,24 +320,7 @@ def test_json_output_schema_complete(tmp_path):
     - updated_wp_count: int (how many WPs updated)
     - tasks_dir: string (for reference)
     """
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    feature_dir = create_test_feature(repo)
+    repo = finalize_repo
 
     # Run finalize-tasks
     result = run_cli(repo, "agent", "feature", "finalize-tasks", "--json")
@@ -19,10 +19,27 @@ from pathlib import Path
 
 import pytest
 
+from tests.utils import GIT_QUIET, GitFastImporter, copy_repo_template
 
-@pytest.fixture
-def feature_with_done_dependency(test_project: Path, run_cli):
-    """Create a feature with WP01 done (review-complete) and WP02 waiting.
+
+def read_for_commit(project: Path, *paths: Path) -> dict[str, bytes]:
+    """Read back files written by a fixture, keyed by repo-relative POSIX path.
+
+    ``test_project`` leaves ``.kittify/metadata.yaml`` modified after its
+    initial commit; it is included so the import commits the same tree a
+    ``git add .`` would.
+    """
+    metadata_file = project / ".kittify" / "metadata.yaml"
+    if metadata_file.exists():
+        paths = (*paths, metadata_file)
+    return {path.relative_to(project).as_posix(): path.read_bytes() for path in paths}
+
+
+@pytest.fixture(scope="session")
+def _done_dependency_template(
+    tmp_path_factory: pytest.TempPathFactory, _test_project_template: Path
+) -> Path:
+    """Build, once per session, a feature with WP01 done (review-complete) and WP02 waiting.
 
     Simulates real workflow where:
     - WP01 was implemented (branch exists with implementation code)
@@ -32,10 +49,16 @@ def feature_with_done_dependency(test_project: Path, run_cli):
 
     Note: "done" does NOT mean merged to target. Merging happens at
     feature level via `spec-kitty merge`.
+
+    ``feature_with_done_dependency`` copies this tree for each test.
     """
+    test_project = copy_repo_template(
+        _test_project_template, tmp_path_factory.mktemp("done_dependency_base") / "project"
+    )
+    git_import = GitFastImporter(test_project)
+
     # Create target branch (2.x)
-    subprocess.run(["git", "checkout", "-b", "2.x"], cwd=test_project, check=True)
-    subprocess.run(["git", "checkout", "main"], cwd=test_project, check=True)
+    git_import.branch("2.x", "main")
 
     # Create feature directory
     feature_slug = "025-cli-event-log-integration"
@@ -100,36 +123,32 @@ def feature_with_done_dependency(test_project: Path, run_cli):
     )
 
     # Commit feature files
-    subprocess.run(["git", "add", "."], cwd=test_project, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add Feature 025 with WP01 done, WP02/WP08 planned"],
-        cwd=test_project,
-        check=True
+    git_import.commit(
+        "main",
+        "Add Feature 025 with WP01 done, WP02/WP08 planned",
+        read_for_commit(test_project, meta_file, wp01_file, wp02_file, wp08_file),
     )
 
-    # Simulate WP01's implementation branch (created during implement, persists after done)
+    # Simulate WP01's implementation branch (created during implement, persists after done).
+    # The implementation only lives on the branch, so it is never written to main's tree.
     wp01_branch = f"{feature_slug}-WP01"
-    subprocess.run(
-        ["git", "checkout", "-b", wp01_branch],
-        cwd=test_project, check=True
+    git_import.branch(wp01_branch, "main")
+    git_import.commit(
+        wp01_branch,
+        "feat(WP01): Event infrastructure implementation",
+        {"src/specify_cli/events/__init__.py": b'"""Event infrastructure (from WP01)."""\n'},
     )
-    (test_project / "src" / "specify_cli" / "events").mkdir(parents=True)
-    events_file = test_project / "src" / "specify_cli" / "events" / "__init__.py"
-    events_file.write_text(
-        '"""Event infrastructure (from WP01)."""\n',
-        encoding="utf-8"
-    )
-    subprocess.run(["git", "add", "."], cwd=test_project, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "feat(WP01): Event infrastructure implementation"],
-        cwd=test_project,
-        check=True
-    )
-    subprocess.run(["git", "checkout", "main"], cwd=test_project, check=True)
+    git_import.finish(head="main")
 
     return test_project
 
 
+@pytest.fixture
+def feature_with_done_dependency(tmp_path: Path, _done_dependency_template: Path) -> Path:
+    """Return a fresh copy of the done-dependency feature project for one test."""
+    return copy_repo_template(_done_dependency_template, tmp_path / "project")
+
+
 def test_implement_after_single_dependency_done(feature_with_done_dependency, run_cli):
     """Test implementing WP02 after WP01 is done (review-complete).
 
@@ -252,32 +271,23 @@ def test_implement_multi_parent_all_done_creates_merge_base(test_project, run_cl
     )
 
     # Commit feature files
-    subprocess.run(["git", "add", "."], cwd=test_project, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add Feature 010 with all deps done"],
-        cwd=test_project,
-        check=True
+    git_import = GitFastImporter(test_project)
+    git_import.commit(
+        "main",
+        "Add Feature 010 with all deps done",
+        read_for_commit(test_project, meta_file, *sorted(tasks_dir.iterdir())),
     )
 
     # Create WP branches with implementation code (simulating done WPs)
     for i in range(1, 4):
         wp_branch = f"{feature_slug}-WP0{i}"
-        subprocess.run(
-            ["git", "checkout", "-b", wp_branch],
-            cwd=test_project, check=True
-        )
-        comp_dir = test_project / "src" / f"component_{i}"
-        comp_dir.mkdir(parents=True, exist_ok=True)
-        (comp_dir / "__init__.py").write_text(
-            f'"""Component {i} implementation."""\n',
-            encoding="utf-8"
-        )
-        subprocess.run(["git", "add", "."], cwd=test_project, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", f"feat(WP0{i}): Component {i} implementation"],
-            cwd=test_project, check=True
+        git_import.branch(wp_branch, "main")
+        git_import.commit(
+            wp_branch,
+            f"feat(WP0{i}): Component {i} implementation",
+            {f"src/component_{i}/__init__.py": f'"""Component {i} implementation."""\n'.encode()},
         )
-        subprocess.run(["git", "checkout", "main"], cwd=test_project, check=True)
+    git_import.finish(head="main")
 
     # Run implement command for WP04 (should auto-detect multi-parent all done)
     result = run_cli(test_project, "implement", "WP04", "--feature", "010-workspace-per-wp", "--force")
@@ -346,11 +356,11 @@ def test_implement_in_progress_dependency_uses_workspace(test_project, run_cli):
     )
 
     # Commit feature files
-    subprocess.run(["git", "add", "."], cwd=test_project, check=True)
+    subprocess.run(["git", "add", "."], cwd=test_project, **GIT_QUIET)
     subprocess.run(
         ["git", "commit", "-m", "Add Feature 025 with WP01 in-progress"],
         cwd=test_project,
-        check=True
+        **GIT_QUIET,
     )
 
     # Run implement command for WP02 (should error - WP01 workspace doesn't exist)
@@ -11,12 +11,17 @@ from pathlib import Path
 import pytest
 
 from specify_cli.git.commit_helpers import safe_commit
+from tests.utils import copy_repo_template
 
 
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing."""
-    repo = tmp_path / "test_repo"
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initial-commit repository once per session.
+
+    ``git_repo`` copies this tree for each test instead of re-running
+    git init/config/add/commit.
+    """
+    repo = tmp_path_factory.mktemp("safe_commit_base") / "test_repo"
     repo.mkdir()
 
     # Initialize git repo
@@ -48,6 +53,12 @@ def git_repo(tmp_path: Path) -> Path:
     return repo
 
 
+@pytest.fixture
+def git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a temporary git repository for testing."""
+    return copy_repo_template(_git_repo_template, tmp_path / "test_repo")
+
+
 def test_safe_commit_preserves_unrelated_staged_files(git_repo: Path):
     """T045: Pre-stage unrelated file, run safe_commit, assert unrelated file remains staged.
 
@@ -8,16 +8,37 @@ This addresses the design flaw where implicit defaults violated SDD principles.
 
 from __future__ import annotations
 
+import copy
 import json
-import os
 import subprocess
 from pathlib import Path
 
 import pytest
 
+from specify_cli.core.feature_detection import get_feature_target_branch
+from tests.test_isolation_helpers import get_venv_python, source_cli_env
+from tests.utils import GIT_QUIET, copy_repo_template
+
 # Get repo root for Python module invocation
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Fixed .kittify contents; written verbatim rather than serialized with PyYAML.
+_CONFIG_YAML = (
+    "agents:\n"
+    "  available:\n"
+    "  - claude\n"
+    "  selection:\n"
+    "    preferred_implementer: claude\n"
+    "    strategy: preferred\n"
+    "vcs:\n"
+    "  type: git\n"
+)
+_METADATA_YAML = (
+    "spec_kitty:\n"
+    "  initialized_at: '2026-01-29T00:00:00Z'\n"
+    "  version: 0.13.8\n"
+)
+
 
 # ============================================================================
 # Helper Functions
@@ -26,14 +47,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 
 def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
     """Execute spec-kitty CLI using Python module invocation."""
-    from tests.test_isolation_helpers import get_venv_python
-
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(
-        os.pathsep
-    )
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
+    env = source_cli_env()
     command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
     return subprocess.run(
         command,
@@ -50,78 +64,69 @@ def init_test_repo(tmp_path: Path) -> Path:
     repo.mkdir()
 
     # Initialize git
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    subprocess.run(["git", "init", "-b", "main"], cwd=repo, **GIT_QUIET)
+    # Identity written straight into .git/config instead of two `git config` runs
+    with (repo / ".git" / "config").open("a", encoding="utf-8") as config:
+        config.write("[user]\n\tname = Test User\n\temail = test@example.com\n")
 
     # Create minimal .kittify structure (not using spec-kitty init to avoid interactive prompts)
     kittify = repo / ".kittify"
     kittify.mkdir()
 
-    # Create minimal config
-    import yaml
-    config = {
-        "vcs": {"type": "git"},
-        "agents": {
-            "available": ["claude"],
-            "selection": {"strategy": "preferred", "preferred_implementer": "claude"}
-        }
-    }
-    (kittify / "config.yaml").write_text(yaml.dump(config))
-
-    # Create minimal metadata
-    metadata = {
-        "spec_kitty": {
-            "version": "0.13.8",
-            "initialized_at": "2026-01-29T00:00:00Z"
-        }
-    }
-    (kittify / "metadata.yaml").write_text(yaml.dump(metadata))
+    # Create minimal config and metadata
+    (kittify / "config.yaml").write_text(_CONFIG_YAML)
+    (kittify / "metadata.yaml").write_text(_METADATA_YAML)
 
     # Create initial commit
     (repo / "README.md").write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=repo, **GIT_QUIET)
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
         cwd=repo,
-        check=True,
-        capture_output=True,
+        **GIT_QUIET,
     )
 
+    # Empty (so untracked) but copied with the template: tests create
+    # their feature directory with a single mkdir
+    (repo / "kitty-specs").mkdir()
+
     return repo
 
 
+@pytest.fixture(scope="session")
+def _repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initialized test repository once per session.
+
+    ``repo`` copies this tree for each test instead of re-running git
+    init/config/add/commit.
+    """
+    return init_test_repo(tmp_path_factory.mktemp("specify_metadata_base"))
+
+
+@pytest.fixture
+def repo(tmp_path: Path, _repo_template: Path) -> Path:
+    """Return a fresh copy of the initialized test repository."""
+    return copy_repo_template(_repo_template, tmp_path / "repo")
+
+
 # ============================================================================
 # Tests for Explicit Metadata Fields
 # ============================================================================
 
 
-def test_specify_creates_explicit_target_branch(tmp_path):
-    """Test that specify command creates meta.json with explicit target_branch field.
+@pytest.fixture(scope="module")
+def _specify_meta(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Write one meta.json following the updated specify template and load it back.
 
-    Validates:
-    - meta.json contains target_branch field
-    - Default value is "main"
-    - Field is not missing or null
+    The schema tests below only read this file, so they share it instead of
+    each writing an identical meta.json. No git repository is needed.
     """
-    repo = init_test_repo(tmp_path)
-
     # Run spec-kitty specify (uses CLI, which invokes the template)
     # Note: This would normally need agent interaction, so we'll create manually
     # following the template pattern
     feature_slug = "001-test-feature"
-    feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir = tmp_path_factory.mktemp("specify_meta") / feature_slug
+    feature_dir.mkdir()
 
     # Create meta.json following the updated template
     meta = {
@@ -137,144 +142,129 @@ def test_specify_creates_explicit_target_branch(tmp_path):
     meta_file = feature_dir / "meta.json"
     meta_file.write_text(json.dumps(meta, indent=2) + "\n")
 
-    # Verify meta.json has explicit fields
-    loaded_meta = json.loads(meta_file.read_text())
-
-    # CRITICAL ASSERTIONS: Fields must exist and be explicit
-    assert "target_branch" in loaded_meta, "meta.json MUST have target_branch field"
-    assert "vcs" in loaded_meta, "meta.json MUST have vcs field"
-
-    assert loaded_meta["target_branch"] == "main", "Default target_branch should be 'main'"
-    assert loaded_meta["vcs"] == "git", "Default vcs should be 'git'"
-
-
-def test_specify_target_branch_not_null(tmp_path):
-    """Test that target_branch is not null or empty string.
-
-    Validates:
-    - target_branch is a non-empty string
-    - target_branch is a valid branch name
-    """
-    repo = init_test_repo(tmp_path)
-
-    feature_slug = "002-test-feature"
-    feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
-
-    meta = {
-        "feature_number": "002",
-        "slug": feature_slug,
-        "friendly_name": "Test Feature",
-        "mission": "software-dev",
-        "source_description": "Test feature",
-        "created_at": "2026-01-29T00:00:00Z",
-        "target_branch": "main",
-        "vcs": "git",
-    }
-    meta_file = feature_dir / "meta.json"
-    meta_file.write_text(json.dumps(meta, indent=2) + "\n")
-
-    loaded_meta = json.loads(meta_file.read_text())
-
-    # Verify not null/empty
-    assert loaded_meta["target_branch"] is not None
-    assert loaded_meta["target_branch"] != ""
-    assert isinstance(loaded_meta["target_branch"], str)
-    assert len(loaded_meta["target_branch"]) > 0
-
-
-def test_specify_vcs_not_null(tmp_path):
-    """Test that vcs is not null or empty string.
-
-    Validates:
-    - vcs is a non-empty string
-    - vcs is a valid value ('git' or 'jj')
-    """
-    repo = init_test_repo(tmp_path)
-
-    feature_slug = "003-test-feature"
-    feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
-
-    meta = {
-        "feature_number": "003",
-        "slug": feature_slug,
-        "friendly_name": "Test Feature",
-        "mission": "software-dev",
-        "source_description": "Test feature",
-        "created_at": "2026-01-29T00:00:00Z",
-        "target_branch": "main",
-        "vcs": "git",
-    }
-    meta_file = feature_dir / "meta.json"
-    meta_file.write_text(json.dumps(meta, indent=2) + "\n")
-
-    loaded_meta = json.loads(meta_file.read_text())
-
-    # Verify not null/empty
-    assert loaded_meta["vcs"] is not None
-    assert loaded_meta["vcs"] != ""
-    assert isinstance(loaded_meta["vcs"], str)
-    assert loaded_meta["vcs"] in ("git", "jj"), "vcs must be 'git' or 'jj'"
-
-
-def test_specify_all_required_fields_present(tmp_path):
-    """Test that meta.json contains all required fields.
-
-    Validates complete schema:
-    - feature_number
-    - slug
-    - friendly_name
-    - mission
-    - source_description
-    - created_at
-    - target_branch (NEW - required as of this fix)
-    - vcs (NEW - required as of this fix)
-    """
-    repo = init_test_repo(tmp_path)
-
-    feature_slug = "004-complete-test"
-    feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
-
-    meta = {
-        "feature_number": "004",
-        "slug": feature_slug,
-        "friendly_name": "Complete Test",
-        "mission": "software-dev",
-        "source_description": "Test all fields",
-        "created_at": "2026-01-29T00:00:00Z",
-        "target_branch": "main",
-        "vcs": "git",
-    }
-    meta_file = feature_dir / "meta.json"
-    meta_file.write_text(json.dumps(meta, indent=2) + "\n")
-
-    loaded_meta = json.loads(meta_file.read_text())
-
-    # Required fields (original)
-    required_fields = [
-        "feature_number",
-        "slug",
-        "friendly_name",
-        "mission",
-        "source_description",
-        "created_at",
-    ]
-
-    for field in required_fields:
-        assert field in loaded_meta, f"Required field '{field}' missing"
-
-    # New required fields (as of this fix)
-    new_required_fields = ["target_branch", "vcs"]
-
-    for field in new_required_fields:
-        assert field in loaded_meta, f"Required field '{field}' missing (explicit defaults)"
-        assert loaded_meta[field] is not None, f"Field '{field}' must not be null"
-        assert loaded_meta[field] != "", f"Field '{field}' must not be empty"
-
-
-def test_specify_dual_branch_feature_can_override(tmp_path):
+    return json.loads(meta_file.read_text())
+
+
+@pytest.fixture
+def specify_meta(_specify_meta: dict) -> dict:
+    """Return a private copy of the shared meta.json contents for one test."""
+    return copy.deepcopy(_specify_meta)
+
+
+class TestSpecifyMeta:
+    """Schema checks on a meta.json created by the specify template."""
+
+    def test_specify_creates_explicit_target_branch(self, specify_meta):
+        """Test that specify command creates meta.json with explicit target_branch field.
+
+        Validates:
+        - meta.json contains target_branch field
+        - Default value is "main"
+        - Field is not missing or null
+        """
+        loaded_meta = specify_meta
+
+        # CRITICAL ASSERTIONS: Fields must exist and be explicit
+        assert "target_branch" in loaded_meta, "meta.json MUST have target_branch field"
+        assert "vcs" in loaded_meta, "meta.json MUST have vcs field"
+
+        assert loaded_meta["target_branch"] == "main", "Default target_branch should be 'main'"
+        assert loaded_meta["vcs"] == "git", "Default vcs should be 'git'"
+
+    def test_specify_target_branch_not_null(self, specify_meta):
+        """Test that target_branch is not null or empty string.
+
+        Validates:
+        - target_branch is a non-empty string
+        - target_branch is a valid branch name
+        """
+        loaded_meta = specify_meta
+
+        # Verify not null/empty
+        assert loaded_meta["target_branch"] is not None
+        assert loaded_meta["target_branch"] != ""
+        assert isinstance(loaded_meta["target_branch"], str)
+        assert len(loaded_meta["target_branch"]) > 0
+
+    def test_specify_vcs_not_null(self, specify_meta):
+        """Test that vcs is not null or empty string.
+
+        Validates:
+        - vcs is a non-empty string
+        - vcs is a valid value ('git' or 'jj')
+        """
+        loaded_meta = specify_meta
+
+        # Verify not null/empty
+        assert loaded_meta["vcs"] is not None
+        assert loaded_meta["vcs"] != ""
+        assert isinstance(loaded_meta["vcs"], str)
+        assert loaded_meta["vcs"] in ("git", "jj"), "vcs must be 'git' or 'jj'"
+
+    def test_specify_all_required_fields_present(self, specify_meta):
+        """Test that meta.json contains all required fields.
+
+        Validates complete schema:
+        - feature_number
+        - slug
+        - friendly_name
+        - mission
+        - source_description
+        - created_at
+        - target_branch (NEW - required as of this fix)
+        - vcs (NEW - required as of this fix)
+        """
+        loaded_meta = specify_meta
+
+        # Required fields (original)
+        required_fields = [
+            "feature_number",
+            "slug",
+            "friendly_name",
+            "mission",
+            "source_description",
+            "created_at",
+        ]
+
+        for field in required_fields:
+            assert field in loaded_meta, f"Required field '{field}' missing"
+
+        # New required fields (as of this fix)
+        new_required_fields = ["target_branch", "vcs"]
+
+        for field in new_required_fields:
+            assert field in loaded_meta, f"Required field '{field}' missing (explicit defaults)"
+            assert loaded_meta[field] is not None, f"Field '{field}' must not be null"
+            assert loaded_meta[field] != "", f"Field '{field}' must not be empty"
+
+    def test_json_schema_validation(self, specify_meta):
+        """Test that meta.json follows expected schema.
+
+        Validates:
+        - All required fields present
+        - Correct types (strings, not nulls)
+        - No unexpected fields that could cause confusion
+        """
+        loaded_meta = specify_meta
+
+        # Type validations
+        assert isinstance(loaded_meta["feature_number"], str)
+        assert isinstance(loaded_meta["slug"], str)
+        assert isinstance(loaded_meta["friendly_name"], str)
+        assert isinstance(loaded_meta["mission"], str)
+        assert isinstance(loaded_meta["source_description"], str)
+        assert isinstance(loaded_meta["created_at"], str)
+        assert isinstance(loaded_meta["target_branch"], str)  # NEW
+        assert isinstance(loaded_meta["vcs"], str)  # NEW
+
+        # Value constraints
+        assert loaded_meta["target_branch"] in ("main", "2.x", "custom-branch"), \
+            "target_branch should be a valid branch name"
+        assert loaded_meta["vcs"] in ("git", "jj"), \
+            "vcs should be 'git' or 'jj'"
+
+
+def test_specify_dual_branch_feature_can_override(repo):
     """Test that target_branch can be set to '2.x' for dual-branch features.
 
     Validates:
@@ -282,14 +272,12 @@ def test_specify_dual_branch_feature_can_override(tmp_path):
     - User can override to '2.x'
     - Value is persisted correctly
     """
-    repo = init_test_repo(tmp_path)
-
     # Create 2.x branch
-    subprocess.run(["git", "branch", "2.x"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "branch", "2.x"], cwd=repo, **GIT_QUIET)
 
     feature_slug = "025-saas-feature"
     feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir.mkdir()
 
     # Create meta.json with target_branch: "2.x" (user override)
     meta = {
@@ -312,7 +300,7 @@ def test_specify_dual_branch_feature_can_override(tmp_path):
     assert "target_branch" in loaded_meta  # Explicit, not implicit
 
 
-def test_get_feature_target_branch_reads_explicit_value(tmp_path):
+def test_get_feature_target_branch_reads_explicit_value(repo):
     """Test that get_feature_target_branch reads the explicit value.
 
     Validates:
@@ -320,14 +308,10 @@ def test_get_feature_target_branch_reads_explicit_value(tmp_path):
     - Returns explicit value (not default)
     - Works for both "main" and "2.x"
     """
-    from specify_cli.core.feature_detection import get_feature_target_branch
-
-    repo = init_test_repo(tmp_path)
-
     # Create feature with explicit target_branch
     feature_slug = "005-explicit-test"
     feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir.mkdir()
 
     meta = {
         "feature_number": "005",
@@ -346,7 +330,7 @@ def test_get_feature_target_branch_reads_explicit_value(tmp_path):
     assert target == "custom-branch", "Should read explicit target_branch value"
 
 
-def test_legacy_features_still_work_with_default(tmp_path):
+def test_legacy_features_still_work_with_default(repo):
     """Test backward compatibility for features created before this fix.
 
     Validates:
@@ -354,14 +338,10 @@ def test_legacy_features_still_work_with_default(tmp_path):
     - get_feature_target_branch returns "main" as safe default
     - No crashes or errors
     """
-    from specify_cli.core.feature_detection import get_feature_target_branch
-
-    repo = init_test_repo(tmp_path)
-
     # Create legacy feature WITHOUT target_branch (pre-0.13.8 style)
     feature_slug = "006-legacy-feature"
     feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir.mkdir()
 
     meta = {
         "feature_number": "006",
@@ -379,7 +359,7 @@ def test_legacy_features_still_work_with_default(tmp_path):
     assert target == "main", "Legacy features should default to 'main'"
 
 
-def test_explicit_fields_prevent_ambiguity(tmp_path):
+def test_explicit_fields_prevent_ambiguity(repo):
     """Test that explicit fields make behavior predictable.
 
     Validates:
@@ -387,13 +367,11 @@ def test_explicit_fields_prevent_ambiguity(tmp_path):
     - No environment-dependent behavior
     - Configuration is self-documenting
     """
-    repo = init_test_repo(tmp_path)
-
     # Create two features with different targets
     for feature_num, target in [("007", "main"), ("008", "2.x")]:
         feature_slug = f"{feature_num}-feature"  # 007-feature, 008-feature
         feature_dir = repo / "kitty-specs" / feature_slug
-        feature_dir.mkdir(parents=True)
+        feature_dir.mkdir()
 
         meta = {
             "feature_number": feature_num,
@@ -406,8 +384,6 @@ def test_explicit_fields_prevent_ambiguity(tmp_path):
         meta_file.write_text(json.dumps(meta, indent=2) + "\n")
 
     # Read both features
-    from specify_cli.core.feature_detection import get_feature_target_branch
-
     target_007 = get_feature_target_branch(repo, "007-feature")
     target_008 = get_feature_target_branch(repo, "008-feature")
 
@@ -423,53 +399,7 @@ def test_explicit_fields_prevent_ambiguity(tmp_path):
     assert meta_008["target_branch"] == "2.x", "Visible in metadata"
 
 
-def test_json_schema_validation(tmp_path):
-    """Test that meta.json follows expected schema.
-
-    Validates:
-    - All required fields present
-    - Correct types (strings, not nulls)
-    - No unexpected fields that could cause confusion
-    """
-    repo = init_test_repo(tmp_path)
-
-    feature_slug = "009-schema-test"
-    feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
-
-    meta = {
-        "feature_number": "009",
-        "slug": feature_slug,
-        "friendly_name": "Schema Test",
-        "mission": "software-dev",
-        "source_description": "Test schema",
-        "created_at": "2026-01-29T00:00:00Z",
-        "target_branch": "main",
-        "vcs": "git",
-    }
-    meta_file = feature_dir / "meta.json"
-    meta_file.write_text(json.dumps(meta, indent=2) + "\n")
-
-    loaded_meta = json.loads(meta_file.read_text())
-
-    # Type validations
-    assert isinstance(loaded_meta["feature_number"], str)
-    assert isinstance(loaded_meta["slug"], str)
-    assert isinstance(loaded_meta["friendly_name"], str)
-    assert isinstance(loaded_meta["mission"], str)
-    assert isinstance(loaded_meta["source_description"], str)
-    assert isinstance(loaded_meta["created_at"], str)
-    assert isinstance(loaded_meta["target_branch"], str)  # NEW
-    assert isinstance(loaded_meta["vcs"], str)  # NEW
-
-    # Value constraints
-    assert loaded_meta["target_branch"] in ("main", "2.x", "custom-branch"), \
-        "target_branch should be a valid branch name"
-    assert loaded_meta["vcs"] in ("git", "jj"), \
-        "vcs should be 'git' or 'jj'"
-
-
-def test_explicit_fields_in_git_history(tmp_path):
+def test_explicit_fields_in_git_history(repo):
     """Test that meta.json with explicit fields is committed properly.
 
     Validates:
@@ -477,11 +407,9 @@ def test_explicit_fields_in_git_history(tmp_path):
     - Explicit fields visible in git history
     - Can diff meta.json changes across commits
     """
-    repo = init_test_repo(tmp_path)
-
     feature_slug = "010-git-test"
     feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir.mkdir()
 
     # Create initial meta.json
     meta = {
@@ -495,13 +423,8 @@ def test_explicit_fields_in_git_history(tmp_path):
     meta_file.write_text(json.dumps(meta, indent=2) + "\n")
 
     # Commit
-    subprocess.run(["git", "add", str(feature_dir)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add feature 010"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    subprocess.run(["git", "add", str(feature_dir)], cwd=repo, **GIT_QUIET)
+    subprocess.run(["git", "commit", "-m", "Add feature 010"], cwd=repo, **GIT_QUIET)
 
     # Verify commit contains explicit fields
     result = subprocess.run(
@@ -543,7 +466,7 @@ def test_template_fix_applies_to_all_agents(tmp_path):
     assert "vcs" in content or "VCS" in content, "Template should document vcs"
 
 
-def test_comparison_implicit_vs_explicit(tmp_path):
+def test_comparison_implicit_vs_explicit(repo):
     """Test demonstrating the difference between implicit and explicit defaults.
 
     This test documents WHY the fix matters.
@@ -560,13 +483,9 @@ def test_comparison_implicit_vs_explicit(tmp_path):
     - Debugging: Can see config by reading file
     - Dual-branch: Can grep for target_branch: "2.x"
     """
-    from specify_cli.core.feature_detection import get_feature_target_branch
-
-    repo = init_test_repo(tmp_path)
-
     # Implicit style (legacy - BAD)
     legacy_dir = repo / "kitty-specs/011-implicit"
-    legacy_dir.mkdir(parents=True)
+    legacy_dir.mkdir()
     legacy_meta = {
         "feature_number": "011",
         "slug": "011-implicit",
@@ -578,7 +497,7 @@ def test_comparison_implicit_vs_explicit(tmp_path):
 
     # Explicit style (new - GOOD)
     explicit_dir = repo / "kitty-specs/012-explicit"
-    explicit_dir.mkdir(parents=True)
+    explicit_dir.mkdir()
     explicit_meta = {
         "feature_number": "012",
         "slug": "012-explicit",
@@ -607,7 +526,7 @@ def test_comparison_implicit_vs_explicit(tmp_path):
     # With implicit, you can't tell which features target which branch
 
 
-def test_explicit_fields_survive_roundtrip(tmp_path):
+def test_explicit_fields_survive_roundtrip(repo):
     """Test that explicit fields survive read-write-read cycles.
 
     Validates:
@@ -615,11 +534,9 @@ def test_explicit_fields_survive_roundtrip(tmp_path):
     - No accidental deletion
     - Format preserved
     """
-    repo = init_test_repo(tmp_path)
-
     feature_slug = "013-roundtrip"
     feature_dir = repo / "kitty-specs" / feature_slug
-    feature_dir.mkdir(parents=True)
+    feature_dir.mkdir()
     meta_file = feature_dir / "meta.json"
 
     # Write with explicit fields
@@ -11,15 +11,13 @@ Tests the complete workflow:
 
 from __future__ import annotations
 
-import os
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
-# Get repo root for Python module invocation
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from tests.test_isolation_helpers import get_venv_python, source_cli_env
 
 
 # ============================================================================
@@ -32,14 +30,7 @@ def run_cli(project_path: Path, *args: str) -> subprocess.CompletedProcess:
 
     Uses venv python and python -m instead of shelling out to binary for better test reliability.
     """
-    from tests.test_isolation_helpers import get_venv_python
-
-    env = os.environ.copy()
-    src_path = REPO_ROOT / "src"
-    env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(
-        os.pathsep
-    )
-    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))
+    env = source_cli_env()
     command = [str(get_venv_python()), "-m", "specify_cli.__init__", *args]
     return subprocess.run(
         command,
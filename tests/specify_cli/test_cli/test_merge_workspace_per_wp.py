@@ -445,14 +445,14 @@ class TestWorkspacePerWpMergeIntegration:
             capture_output=True,
         )
 
-        for wp_num in [1, 2, 3]:
-            branch_name = f"010-test-feature-WP{wp_num:02d}"
-            subprocess.run(
-                ["git", "merge", "--no-ff", branch_name, "-m", f"Merge WP{wp_num:02d}"],
-                cwd=workspace_per_wp_repo,
-                check=True,
-                capture_output=True,
-            )
+        # Octopus-merge all WP branches in one call
+        subprocess.run(
+            ["git", "merge", "-m", "Merge WP01-WP03"]
+            + [f"010-test-feature-WP{wp_num:02d}" for wp_num in [1, 2, 3]],
+            cwd=workspace_per_wp_repo,
+            check=True,
+            capture_output=True,
+        )
 
         # Remove worktrees first (required before deleting branches)
         for wp_num in [1, 2, 3]:
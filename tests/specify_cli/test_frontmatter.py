@@ -6,6 +6,7 @@ from specify_cli.frontmatter import (
     FrontmatterManager,
     FrontmatterError,
     read_frontmatter,
+    read_frontmatter_str,
     write_frontmatter,
     validate_frontmatter,
 )
@@ -350,3 +351,64 @@ subtasks:
         # Other fields preserved
         assert new_frontmatter["title"] == "Updated Legacy WP"
         assert new_frontmatter["subtasks"] == ["T001"]
+
+
+class TestParseCache:
+    """Test reuse of parsed frontmatter across reads."""
+
+    def test_repeated_reads_return_independent_copies(self, tmp_path):
+        """Test mutating one read result does not leak into later reads."""
+        content = """---
+work_package_id: "WP01"
+title: "Cached WP"
+lane: "planned"
+dependencies: ["WP02"]
+---
+# Content
+"""
+        first = tmp_path / "WP01.md"
+        second = tmp_path / "WP02.md"
+        first.write_text(content)
+        second.write_text(content)
+        manager = FrontmatterManager()
+
+        frontmatter, _ = manager.read(first)
+        frontmatter["lane"] = "done"
+        frontmatter["dependencies"].append("WP03")
+
+        again, _ = manager.read(second)
+        assert again["lane"] == "planned"
+        assert again["dependencies"] == ["WP02"]
+
+    def test_edited_file_is_reparsed(self, temp_wp_file):
+        """Test a rewritten file is never served from a stale parse."""
+        wp_file = temp_wp_file("""---
+work_package_id: "WP01"
+title: "Test WP"
+lane: "planned"
+---
+""")
+        assert read_frontmatter(wp_file)[0]["lane"] == "planned"
+
+        wp_file.write_text(wp_file.read_text().replace("planned", "doing"))
+        assert read_frontmatter(wp_file)[0]["lane"] == "doing"
+
+
+class TestParseFromString:
+    """Test parsing frontmatter from text without a file."""
+
+    def test_parse_string_matches_file(self, temp_wp_file):
+        """Test string parsing returns the same data as reading the file."""
+        content = """---
+work_package_id: "WP01"
+lane: "doing"
+dependencies: []
+---
+# Body
+"""
+        assert read_frontmatter_str(content) == read_frontmatter(temp_wp_file(content))
+
+    def test_parse_string_without_frontmatter(self):
+        """Test string without frontmatter raises a clear error."""
+        with pytest.raises(FrontmatterError, match="<string>"):
+            read_frontmatter_str("# No frontmatter\n")
@@ -11,6 +11,7 @@ import os
 import subprocess
 import sys
 import tomllib
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -19,9 +20,12 @@ import pytest
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=1)
 def get_source_version() -> str:
     """Get version from pyproject.toml (single source of truth).
 
+    Parsed once per session; pyproject.toml does not change under a run.
+
     Returns:
         Version string (e.g., "0.10.13")
     """
@@ -31,7 +35,16 @@ def get_source_version() -> str:
 
 def get_venv_python() -> Path:
     """Return the python executable for the test venv if configured."""
-    venv_dir = os.getenv("SPEC_KITTY_TEST_VENV")
+    return _venv_python(os.getenv("SPEC_KITTY_TEST_VENV"))
+
+
+@lru_cache(maxsize=None)
+def _venv_python(venv_dir: str | None) -> Path:
+    """Resolve the venv interpreter once per venv directory.
+
+    Keyed on the directory rather than cached outright: the session
+    ``test_venv`` fixture sets ``SPEC_KITTY_TEST_VENV`` after collection.
+    """
     if not venv_dir:
         return Path(sys.executable)
 
@@ -87,6 +100,32 @@ def assert_test_isolation() -> None:
         )
 
 
+_SOURCE_PATH = str(REPO_ROOT / "src")
+_TEMPLATE_ROOT = str(REPO_ROOT)
+
+
+def source_cli_env(env_overrides: dict[str, str] | None = None) -> dict[str, str]:
+    """Environment for CLI subprocesses that import ``specify_cli`` from source.
+
+    Prepends ``src/`` to ``PYTHONPATH`` and defaults
+    ``SPEC_KITTY_TEMPLATE_ROOT`` to the repo. Built from ``os.environ`` on
+    every call, so variables set by fixtures or ``monkeypatch`` are seen.
+
+    Args:
+        env_overrides: Extra variables layered over the environment
+
+    Returns:
+        Environment dict for ``subprocess.run(env=...)``
+    """
+    env = dict(os.environ)
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = f"{_SOURCE_PATH}{os.pathsep}{existing}" if existing else _SOURCE_PATH
+    env.setdefault("SPEC_KITTY_TEMPLATE_ROOT", _TEMPLATE_ROOT)
+    if env_overrides:
+        env.update(env_overrides)
+    return env
+
+
 def run_cli_subprocess(
     project_path: Path,
     *args: str,
@@ -125,10 +164,99 @@ def run_cli_subprocess(
     )
 
 
+@lru_cache(maxsize=None)
+def _click_command(app):
+    """Build the Click command tree for a Typer ``app`` once per session."""
+    from typer.main import get_command
+
+    return get_command(app)
+
+
+def invoke_cli_in_process(
+    app,
+    args: list[str],
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Invoke a Typer ``app`` through its cached Click command.
+
+    ``CliRunner.invoke`` rebuilds the Click command tree (~40 ms) on every
+    call. This runs the command built once by :func:`_click_command` inside
+    ``CliRunner.isolation()``, so only public Click/Typer API is used.
+    Exceptions other than ``SystemExit`` propagate to the test.
+
+    Args:
+        app: Typer application to invoke
+        args: CLI arguments
+        env: Environment overrides for the duration of the call
+
+    Returns:
+        CompletedProcess with the exit code and captured stdout/stderr
+    """
+    from typer.testing import CliRunner
+
+    command = _click_command(app)
+    exit_code = 0
+    with CliRunner().isolation(env=env) as streams:
+        try:
+            command.main(args=list(args), prog_name=command.name or "root")
+        except SystemExit as exc:
+            if isinstance(exc.code, int):
+                exit_code = exc.code
+            elif exc.code is not None:
+                sys.stdout.write(f"{exc.code}\n")
+                exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            stdout = streams[0].getvalue()
+            # Click < 8.2 mixes stderr into stdout by default and yields None
+            stderr = streams[1].getvalue() if streams[1] is not None else b""
+
+    return subprocess.CompletedProcess(
+        list(args),
+        exit_code,
+        stdout=stdout.decode("utf-8", "replace").replace("\r\n", "\n"),
+        stderr=stderr.decode("utf-8", "replace").replace("\r\n", "\n"),
+    )
+
+
+def run_cli_in_process(
+    project_path: Path,
+    *args: str,
+) -> subprocess.CompletedProcess[str]:
+    """Run CLI inside the test process via :func:`invoke_cli_in_process`.
+
+    Skips interpreter start-up and the ``specify_cli`` import that every
+    subprocess call pays. The result mirrors ``subprocess.CompletedProcess``
+    so callers can switch between this and :func:`run_cli_subprocess`.
+    Use the subprocess helper when a test depends on real process behavior.
+
+    Args:
+        project_path: Path to test project directory (used as cwd)
+        *args: CLI arguments
+
+    Returns:
+        CompletedProcess with the exit code and captured stdout/stderr
+    """
+    from specify_cli import app
+
+    env = {"SPEC_KITTY_TEMPLATE_ROOT": os.environ.get("SPEC_KITTY_TEMPLATE_ROOT", str(REPO_ROOT))}
+
+    previous_cwd = os.getcwd()
+    os.chdir(project_path)
+    try:
+        return invoke_cli_in_process(app, list(args), env=env)
+    finally:
+        os.chdir(previous_cwd)
+
+
 __all__ = [
     "get_source_version",
     "get_installed_version",
     "assert_test_isolation",
+    "source_cli_env",
     "run_cli_subprocess",
+    "invoke_cli_in_process",
+    "run_cli_in_process",
     "REPO_ROOT",
 ]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +16,32 @@ TASKS_DIR = REPO_ROOT / "src" / "specify_cli" / "scripts" / "tasks"
 if str(TASKS_DIR) not in sys.path:
     sys.path.insert(0, str(TASKS_DIR))
 
+# Setup git calls whose stdout is never read. stderr is captured so a
+# failing call's CalledProcessError still carries git's message.
+GIT_QUIET = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE, "check": True}
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink immutable git objects; copy everything else."""
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def copy_repo_template(template: Path, repo: Path) -> Path:
+    """Copy a session-built git repository template to ``repo`` for one test.
+
+    Object files are never rewritten in place, so they are hardlinked
+    instead of copied; the index, refs and working tree get real copies
+    because tests modify them.
+    """
+    shutil.copytree(template, repo, symlinks=True, copy_function=_link_or_copy)
+    return repo
+
 
 def run(cmd: list[str], *, cwd: Path, env: Optional[dict[str, str]] = None) -> subprocess.CompletedProcess:
     process_env = os.environ.copy()
@@ -87,3 +116,238 @@ def write_wp(
     updated_front = set_scalar(set_scalar(set_scalar(set_scalar(front, "lane", lane), "agent", agent), "assignee", assignee), "shell_pid", shell_pid)
     path.write_text(build_document(updated_front, updated_body, padding), encoding="utf-8")
     return path
+
+
+class CommitReader:
+    """Answer commit lookups from one persistent ``git cat-file --batch``.
+
+    Integration-test assertion helpers used to fork ``git log`` or
+    ``git merge-base`` on every call; a reader stays open for the whole test
+    instead and walks commit objects itself, in ``git log``'s default
+    (commit date) order.
+
+    Commit objects are immutable, so parsed commits are kept by SHA: a
+    repeated lookup on a branch only resolves the (possibly moved) tip and
+    walks the already-parsed history from there. Walks are cached by
+    ``(tip, limit)`` too, so assertions repeated against an unchanged branch
+    cost a single ref lookup.
+    """
+
+    def __init__(self, repo: Path):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._commits: dict[str, tuple[str, list[str], int, str]] = {}
+        self._logs: dict[tuple[str, int | None], tuple[tuple[str, str], ...]] = {}
+
+    def _commit(self, rev: str) -> tuple[str, list[str], int, str]:
+        """Return ``(sha, parents, commit_time, subject)`` for ``rev``."""
+        cached = self._commits.get(rev)
+        if cached is not None:
+            return cached
+
+        self._proc.stdin.write(rev.encode() + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if header[-1] == b"missing":
+            raise KeyError(rev)
+        sha, _kind, size = header
+        raw = self._proc.stdout.read(int(size) + 1)[:-1]
+
+        # Parse headers as bytes; only the subject line is ever decoded
+        headers, _, message = raw.partition(b"\n\n")
+        parents = []
+        commit_time = 0
+        for line in headers.split(b"\n"):
+            key, _, value = line.partition(b" ")
+            if key == b"parent":
+                parents.append(value.decode("ascii"))
+            elif key == b"committer":
+                commit_time = int(value.rsplit(b" ", 2)[1])
+        sha = sha.decode("ascii")
+        subject = message.split(b"\n", 1)[0].decode()
+        commit = self._commits[sha] = (sha, parents, commit_time, subject)
+        return commit
+
+    def resolve(self, rev: str) -> str:
+        """Return the full commit SHA for ``rev``."""
+        return self._commit(rev)[0]
+
+    def log(self, rev: str, limit: int | None = None) -> list[tuple[str, str]]:
+        """Return ``(sha, subject)`` pairs reachable from ``rev``, newest first."""
+        sha, parents, commit_time, subject = self._commit(rev)
+        key = (sha, limit)
+        cached = self._logs.get(key)
+        if cached is not None:
+            return list(cached)
+
+        seen = {sha}
+        queue = [(-commit_time, 0, sha, parents, subject)]
+        order = 1
+        entries: list[tuple[str, str]] = []
+        while queue and (limit is None or len(entries) < limit):
+            _, _, sha, parents, subject = heapq.heappop(queue)
+            entries.append((sha, subject))
+            for parent in parents:
+                if parent in seen:
+                    continue
+                seen.add(parent)
+                p_sha, p_parents, p_time, p_subject = self._commit(parent)
+                heapq.heappush(queue, (-p_time, order, p_sha, p_parents, p_subject))
+                order += 1
+        self._logs[key] = tuple(entries)
+        return entries
+
+    def merge_base(self, a: str, b: str) -> str | None:
+        """Return the newest commit reachable from both ``a`` and ``b``.
+
+        Matches ``git merge-base`` for the fork-and-advance histories these
+        tests build; returns ``None`` when the histories are unrelated.
+        """
+        reachable = {sha for sha, _ in self.log(a)}
+        return next((sha for sha, _ in self.log(b) if sha in reachable), None)
+
+    def close(self) -> None:
+        self._proc.stdin.close()
+        self._proc.wait()
+
+
+_COMMIT_READERS: dict[Path, CommitReader] = {}
+
+
+def commit_reader(repo: Path) -> CommitReader:
+    """Return the open :class:`CommitReader` for ``repo``, starting one if needed."""
+    reader = _COMMIT_READERS.get(repo)
+    if reader is None:
+        reader = _COMMIT_READERS[repo] = CommitReader(repo)
+    return reader
+
+
+def close_commit_readers() -> None:
+    """Shut down every cat-file process started through :func:`commit_reader`."""
+    while _COMMIT_READERS:
+        _COMMIT_READERS.popitem()[1].close()
+
+
+class GitFastImporter:
+    """Stream commits into a repo through one ``git fast-import`` process.
+
+    Replaces the add/commit/checkout/merge subprocess bursts in test setup.
+    fast-import only writes objects and refs, so :meth:`finish` points HEAD at
+    the requested branch and resets the index to it; the working tree is left
+    untouched (callers write the same files to disk themselves).
+    """
+
+    def __init__(self, repo: Path):
+        self.repo = repo
+        self._proc = subprocess.Popen(
+            ["git", "fast-import", "--quiet", "--date-format=raw"],
+            cwd=repo,
+            stdin=subprocess.PIPE,
+        )
+        self._next_mark = 1
+        self._tips: dict[str, int] = {}
+        self._bases: dict[str, str] = {}
+        self._files: dict[str, dict[str, int]] = {}
+
+    def _write(self, text: str) -> None:
+        self._proc.stdin.write(text.encode())
+
+    def _data(self, payload: bytes) -> None:
+        self._write(f"data {len(payload)}\n")
+        self._proc.stdin.write(payload + b"\n")
+
+    def _new_mark(self) -> int:
+        mark = self._next_mark
+        self._next_mark += 1
+        return mark
+
+    def _from(self, branch: str) -> str:
+        if branch in self._tips:
+            return f":{self._tips[branch]}"
+        return f"refs/heads/{self._bases.get(branch, branch)}^0"
+
+    def _commit(self, branch: str, message: str, files: dict[str, int], merge: str | None) -> int:
+        mark = self._new_mark()
+        self._write(
+            f"commit refs/heads/{branch}\n"
+            f"mark :{mark}\n"
+            f"committer Test User <test@example.com> {int(time.time())} +0000\n"
+        )
+        self._data(message.encode())
+        self._write(f"from {self._from(branch)}\n")
+        if merge is not None:
+            self._write(f"merge {self._from(merge)}\n")
+        for path, blob_mark in files.items():
+            self._write(f"M 100644 :{blob_mark} {path}\n")
+        self._write("\n")
+        self._tips[branch] = mark
+        self._files.setdefault(branch, {}).update(files)
+        return mark
+
+    def blob(self, data: bytes) -> int:
+        """Emit a blob and return its mark."""
+        mark = self._new_mark()
+        self._write(f"blob\nmark :{mark}\n")
+        self._data(data)
+        return mark
+
+    def commit(self, branch: str, message: str, files: dict[str, bytes]) -> int:
+        """Commit ``files`` (repo-relative path -> content) on top of ``branch``."""
+        marks = {path: self.blob(content) for path, content in files.items()}
+        return self._commit(branch, message, marks, merge=None)
+
+    def merge(self, branch: str, source: str, message: str) -> int:
+        """Record a merge commit of ``source`` into ``branch`` (like ``--no-ff``).
+
+        The merge tree is ``branch``'s tree plus the files committed to
+        ``source`` through this importer; nothing is actually merged. That is
+        only right when ``source`` started from a commit already in ``branch``
+        (so its earlier history adds nothing) and the two touch different
+        paths. Conflicts and changes ``source`` had before the import started
+        are not detected.
+        """
+        return self._commit(branch, message, dict(self._files.get(source, {})), merge=source)
+
+    def fast_forward(self, branch: str, source: str) -> None:
+        """Move ``branch`` to the tip of ``source`` (like ``--ff-only``; no merge commit)."""
+        self.branch(branch, source)
+
+    def branch(self, name: str, start: str) -> None:
+        """Create branch ``name`` at the current tip of ``start``."""
+        self._write(f"reset refs/heads/{name}\nfrom {self._from(start)}\n\n")
+        if start in self._tips:
+            self._tips[name] = self._tips[start]
+        else:
+            self._bases[name] = start
+        self._files[name] = dict(self._files.get(start, {}))
+
+    def finish(self, head: str) -> None:
+        """Flush the stream, point HEAD at ``head`` and sync the index to it."""
+        self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise RuntimeError("git fast-import failed")
+        subprocess.run(
+            ["git", "symbolic-ref", "HEAD", f"refs/heads/{head}"],
+            cwd=self.repo,
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(["git", "reset", "-q"], cwd=self.repo, check=True, capture_output=True)
+
+
+def write_files(repo: Path, files: dict[Path, str]) -> dict[str, bytes]:
+    """Write files to disk and return them keyed by repo-relative POSIX path.
+
+    Each file is encoded once and the same bytes go to disk and into the
+    commit, so the working tree matches the imported blobs exactly.
+    """
+    written: dict[str, bytes] = {}
+    for path, content in files.items():
+        data = content.encode()
+        path.write_bytes(data)
+        written[path.relative_to(repo).as_posix()] = data
+    return written